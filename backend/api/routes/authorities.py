@@ -3,11 +3,14 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session, joinedload, load_only
 
 from backend.api.deps import get_db
+from backend.core.database import json_key_count
 from backend.models.member import Authority, Member, ProductExtraction, ContractProductLink, GWPBreakdown
 from backend.models.contract import Contract
+from backend.models.extraction import Extraction
 from backend.schemas.member import (
     AuthorityResponse,
     AuthorityUpdate,
@@ -29,78 +32,98 @@ def backfill_authorities(db: Session = Depends(get_db)):
         ProductExtraction.status == "completed"
     ).all()
 
-    created_count = 0
+    existing_ids = {
+        row.product_extraction_id
+        for row in db.query(Authority.product_extraction_id).all()
+    }
+
     skipped_count = 0
     errors = []
 
+    pending = []
     for extraction in completed_extractions:
-        # Check if Authority already exists
-        existing = db.query(Authority).filter(
-            Authority.product_extraction_id == extraction.id
-        ).first()
-
-        if existing:
+        if extraction.id in existing_ids:
             skipped_count += 1
-            continue
-
+        else:
+            pending.append(extraction)
+
+    # Prefetch links (with product dimensions), parent extractions and contracts in bulk
+    link_ids = {e.contract_link_id for e in pending}
+    links = {
+        link.id: link
+        for link in db.query(ContractProductLink).filter(
+            ContractProductLink.id.in_(link_ids)
+        ).options(
+            joinedload(ContractProductLink.gwp_breakdown).joinedload(GWPBreakdown.line_of_business),
+            joinedload(ContractProductLink.gwp_breakdown).joinedload(GWPBreakdown.class_of_business),
+            joinedload(ContractProductLink.gwp_breakdown).joinedload(GWPBreakdown.product),
+            joinedload(ContractProductLink.gwp_breakdown).joinedload(GWPBreakdown.sub_product),
+            joinedload(ContractProductLink.gwp_breakdown).joinedload(GWPBreakdown.member_product_program),
+        ).all()
+    } if link_ids else {}
+
+    parent_extraction_ids = {link.extraction_id for link in links.values()}
+    contract_ids_by_extraction = dict(
+        db.query(Extraction.id, Extraction.contract_id).filter(
+            Extraction.id.in_(parent_extraction_ids)
+        ).all()
+    ) if parent_extraction_ids else {}
+
+    contract_ids = set(contract_ids_by_extraction.values())
+    contracts = {
+        contract.id: contract
+        for contract in db.query(Contract.id, Contract.filename).filter(
+            Contract.id.in_(contract_ids)
+        ).all()
+    } if contract_ids else {}
+
+    new_authorities = []
+    for extraction in pending:
         try:
             # Get the contract-product link
-            link = db.query(ContractProductLink).filter(
-                ContractProductLink.id == extraction.contract_link_id
-            ).first()
+            link = links.get(extraction.contract_link_id)
 
             if not link:
                 errors.append(f"Link not found for extraction {extraction.id}")
                 continue
 
             # Get the GWP breakdown with product info
-            gwp = db.query(GWPBreakdown).filter(
-                GWPBreakdown.id == link.gwp_breakdown_id
-            ).first()
+            gwp = link.gwp_breakdown
 
             if not gwp:
                 errors.append(f"GWP breakdown not found for link {link.id}")
                 continue
 
             # Get contract info
-            from backend.models.extraction import Extraction
-            parent_extraction = db.query(Extraction).filter(
-                Extraction.id == link.extraction_id
-            ).first()
-
-            contract = None
-            if parent_extraction:
-                contract = db.query(Contract).filter(
-                    Contract.id == parent_extraction.contract_id
-                ).first()
-
-            # Create Authority
-            authority = Authority(
-                product_extraction_id=extraction.id,
-                contract_link_id=link.id,
-                member_id=gwp.member_id,
-                gwp_breakdown_id=gwp.id,
-                lob_name=gwp.line_of_business.name,
-                cob_name=gwp.class_of_business.name,
-                product_name=gwp.product.name,
-                sub_product_name=gwp.sub_product.name,
-                mpp_name=gwp.member_product_program.name,
-                contract_id=contract.id if contract else None,
-                contract_name=contract.filename if contract else "Unknown",
-                extracted_data=extraction.extracted_data or {},
-                analysis_summary=extraction.analysis_summary,
-            )
-            db.add(authority)
-            created_count += 1
+            contract = contracts.get(contract_ids_by_extraction.get(link.extraction_id))
+
+            new_authorities.append({
+                "product_extraction_id": extraction.id,
+                "contract_link_id": link.id,
+                "member_id": gwp.member_id,
+                "gwp_breakdown_id": gwp.id,
+                "lob_name": gwp.line_of_business.name,
+                "cob_name": gwp.class_of_business.name,
+                "product_name": gwp.product.name,
+                "sub_product_name": gwp.sub_product.name,
+                "mpp_name": gwp.member_product_program.name,
+                "contract_id": contract.id if contract else None,
+                "contract_name": contract.filename if contract else "Unknown",
+                "extracted_data": extraction.extracted_data or {},
+                "analysis_summary": extraction.analysis_summary,
+            })
 
         except Exception as e:
             errors.append(f"Error processing extraction {extraction.id}: {str(e)}")
 
+    # Insert all new Authority rows in a single executemany
+    if new_authorities:
+        db.execute(insert(Authority), new_authorities)
     db.commit()
 
     return {
         "message": "Backfill complete",
-        "created": created_count,
+        "created": len(new_authorities),
         "skipped": skipped_count,
         "errors": errors,
     }
@@ -133,13 +156,32 @@ def list_authorities(
             (Authority.mpp_name.ilike(search_term))
         )
 
-    total = query.count()
-    authorities = query.order_by(Authority.created_at.desc()).offset(skip).limit(limit).all()
+    # Fetch only list columns; count JSON keys in SQL instead of loading extracted_data
+    rows = query.options(
+        load_only(
+            Authority.id,
+            Authority.member_id,
+            Authority.contract_id,
+            Authority.contract_name,
+            Authority.lob_name,
+            Authority.cob_name,
+            Authority.product_name,
+            Authority.sub_product_name,
+            Authority.mpp_name,
+            Authority.created_at,
+            Authority.updated_at,
+        )
+    ).add_columns(
+        json_key_count(Authority.extracted_data).label("field_count"),
+        func.count().over().label("total"),
+    ).order_by(Authority.created_at.desc()).offset(skip).limit(limit).all()
+
+    # Total rides along on each page row; fall back to COUNT past the last page
+    total = rows[0].total if rows else (query.count() if skip else 0)
 
     # Build list items with field count
     items = []
-    for auth in authorities:
-        field_count = len(auth.extracted_data) if auth.extracted_data else 0
+    for auth, field_count, _ in rows:
         items.append(AuthorityListItem(
             id=auth.id,
             member_id=auth.member_id,
@@ -150,7 +192,7 @@ def list_authorities(
             product_name=auth.product_name,
             sub_product_name=auth.sub_product_name,
             mpp_name=auth.mpp_name,
-            field_count=field_count,
+            field_count=field_count or 0,
             created_at=auth.created_at,
             updated_at=auth.updated_at,
         ))
@@ -7,10 +7,11 @@ from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, func
 
 from backend.api.deps import get_db
 from backend.core.config import UPLOADS_DIR, ALLOWED_EXTENSIONS, MAX_UPLOAD_SIZE_MB
@@ -33,13 +34,8 @@ router = APIRouter()
 document_loader = DocumentLoader()
 
 
-def compute_file_hash(file_path: Path) -> str:
-    """Compute SHA-256 hash of file."""
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MAX_UPLOAD_BYTES = MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
 
 @router.post("/upload", response_model=UploadResponse)
@@ -63,38 +59,48 @@ async def upload_contract(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-
-    # Check file size
-    if file_size > MAX_UPLOAD_SIZE_MB * 1024 * 1024:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_UPLOAD_SIZE_MB}MB"
-        )
-
     # Generate unique filename
     unique_id = str(uuid4())
     safe_filename = f"{unique_id}{file_ext}"
     file_path = UPLOADS_DIR / safe_filename
 
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    # Compute hash
-    file_hash = compute_file_hash(file_path)
-
-    # Check for duplicate
-    existing = db.query(Contract).filter(
-        Contract.file_hash == file_hash,
-        Contract.is_deleted == False
-    ).first()
+    # Stream to a temp file, hashing and enforcing the size limit in the same pass
+    tmp_path = file_path.with_suffix(f"{file_ext}.tmp")
+    sha256 = hashlib.sha256()
+    file_size = 0
+    with open(tmp_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_UPLOAD_BYTES:
+                f.close()
+                tmp_path.unlink()
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File too large. Maximum size: {MAX_UPLOAD_SIZE_MB}MB"
+                )
+            sha256.update(chunk)
+            f.write(chunk)
+
+    file_hash = sha256.hexdigest()
+
+    # Check for duplicate (blocking DB and parsing work runs in the threadpool)
+    existing = await run_in_threadpool(
+        db.query(
+            Contract.id,
+            Contract.original_filename,
+            Contract.file_type,
+            Contract.file_size_bytes,
+            Contract.page_count,
+            func.substr(Contract.extracted_text, 1, 2000).label("text_preview"),
+        ).filter(
+            Contract.file_hash == file_hash,
+            Contract.is_deleted == False
+        ).first
+    )
 
     if existing:
-        # Remove uploaded file (duplicate)
-        file_path.unlink()
+        # Discard the temp file (duplicate)
+        tmp_path.unlink()
         # Return duplicate info with 409 status but proper response body
         from fastapi.responses import JSONResponse
         return JSONResponse(
@@ -107,15 +113,17 @@ async def upload_contract(
                 "file_type": existing.file_type,
                 "file_size_bytes": existing.file_size_bytes,
                 "page_count": existing.page_count,
-                "text_preview": (existing.extracted_text or "")[:2000],
+                "text_preview": existing.text_preview or "",
                 "message": "Document already exists",
                 "is_duplicate": True,
             }
         )
 
+    tmp_path.rename(file_path)
+
     # Parse document
     try:
-        loaded_doc = document_loader.load(file_path)
+        loaded_doc = await run_in_threadpool(document_loader.load, file_path)
         extracted_text = loaded_doc.text
         page_count = loaded_doc.page_count
         doc_metadata = loaded_doc.metadata
@@ -141,17 +149,16 @@ async def upload_contract(
     )
 
     db.add(contract)
-    db.commit()
-    db.refresh(contract)
+    await run_in_threadpool(db.commit)
 
     # Return response with preview
     text_preview = extracted_text[:2000] if extracted_text else ""
 
     return UploadResponse(
-        id=contract.id,
-        contract_id=contract.id,
+        id=unique_id,
+        contract_id=unique_id,
         filename=file.filename,
-        file_type=contract.file_type,
+        file_type=file_ext.lstrip("."),
         file_size_bytes=file_size,
         page_count=page_count,
         text_preview=text_preview,
@@ -159,7 +166,7 @@ async def upload_contract(
 
 
 @router.get("/", response_model=ContractListResponse)
-async def list_contracts(
+def list_contracts(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
@@ -173,32 +180,61 @@ async def list_contracts(
             Contract.original_filename.ilike(f"%{search}%")
         )
 
-    # Get total count before pagination
-    total = query.count()
-
-    contracts = query.order_by(Contract.uploaded_at.desc()).offset(skip).limit(limit).all()
-
-    # Add extraction counts
-    result = []
-    for contract in contracts:
-        extraction_count = db.query(func.count(Extraction.id)).filter(
-            Extraction.contract_id == contract.id
-        ).scalar()
-
-        latest_extraction = db.query(Extraction).filter(
-            Extraction.contract_id == contract.id
-        ).order_by(Extraction.created_at.desc()).first()
-
-        result.append(ContractListItem(
+    # Extraction count and latest status per contract, joined in a single query
+    extraction_counts = db.query(
+        Extraction.contract_id,
+        func.count(Extraction.id).label("extraction_count"),
+    ).group_by(Extraction.contract_id).subquery()
+
+    ranked_extractions = db.query(
+        Extraction.contract_id,
+        Extraction.status,
+        func.row_number().over(
+            partition_by=Extraction.contract_id,
+            order_by=Extraction.created_at.desc(),
+        ).label("row_num"),
+    ).subquery()
+
+    # Skip the large extracted_text/document_metadata columns on list pages
+    rows = query.options(
+        load_only(
+            Contract.id,
+            Contract.original_filename,
+            Contract.file_type,
+            Contract.file_size_bytes,
+            Contract.page_count,
+            Contract.uploaded_at,
+        )
+    ).outerjoin(
+        extraction_counts, extraction_counts.c.contract_id == Contract.id
+    ).outerjoin(
+        ranked_extractions,
+        and_(
+            ranked_extractions.c.contract_id == Contract.id,
+            ranked_extractions.c.row_num == 1,
+        ),
+    ).add_columns(
+        extraction_counts.c.extraction_count,
+        ranked_extractions.c.status,
+        func.count().over().label("total"),
+    ).order_by(Contract.uploaded_at.desc()).offset(skip).limit(limit).all()
+
+    # Total rides along on each page row; fall back to COUNT past the last page
+    total = rows[0].total if rows else (query.count() if skip else 0)
+
+    result = [
+        ContractListItem(
             id=contract.id,
             original_filename=contract.original_filename,
             file_type=contract.file_type,
             file_size_bytes=contract.file_size_bytes,
             page_count=contract.page_count,
             uploaded_at=contract.uploaded_at,
-            extraction_count=extraction_count,
-            latest_extraction_status=latest_extraction.status if latest_extraction else None,
-        ))
+            extraction_count=extraction_count or 0,
+            latest_extraction_status=latest_status,
+        )
+        for contract, extraction_count, latest_status, _ in rows
+    ]
 
     return ContractListResponse(
         contracts=result,
@@ -209,40 +245,46 @@ async def list_contracts(
 
 
 @router.get("/{contract_id}/preview", response_model=DocumentPreview)
-async def get_contract_preview(
+def get_contract_preview(
     contract_id: str,
     db: Session = Depends(get_db)
 ):
     """Get parsed document preview with text content."""
-    contract = db.query(Contract).filter(
+    # Slice and measure the text in SQL rather than loading all of it
+    row = db.query(
+        Contract.id,
+        Contract.original_filename,
+        Contract.file_type,
+        Contract.page_count,
+        Contract.document_metadata,
+        func.substr(Contract.extracted_text, 1, 2000).label("text_preview"),
+        func.length(Contract.extracted_text).label("total_characters"),
+    ).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
     ).first()
 
-    if not contract:
+    if not row:
         raise HTTPException(status_code=404, detail="Contract not found")
 
-    text = contract.extracted_text or ""
-    text_preview = text[:2000]
-
     return DocumentPreview(
-        contract_id=contract.id,
-        filename=contract.original_filename,
-        file_type=contract.file_type,
-        page_count=contract.page_count,
-        total_characters=len(text),
-        text_preview=text_preview,
-        metadata=contract.document_metadata or {},
+        contract_id=row.id,
+        filename=row.original_filename,
+        file_type=row.file_type,
+        page_count=row.page_count,
+        total_characters=row.total_characters or 0,
+        text_preview=row.text_preview or "",
+        metadata=row.document_metadata or {},
     )
 
 
 @router.get("/{contract_id}/text")
-async def get_contract_text(
+def get_contract_text(
     contract_id: str,
     db: Session = Depends(get_db)
 ):
     """Get full extracted text."""
-    contract = db.query(Contract).filter(
+    contract = db.query(Contract.extracted_text).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
     ).first()
@@ -253,13 +295,31 @@ async def get_contract_text(
     return {"text": contract.extracted_text or ""}
 
 
+def file_cache_headers(etag: str) -> dict:
+    """Caching headers for a stored contract file, keyed on its content hash."""
+    return {"ETag": f'"{etag}"', "Cache-Control": "private, max-age=3600"}
+
+
+def is_not_modified(request: Request, headers: dict) -> bool:
+    """Whether the client's If-None-Match already matches our ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or headers["ETag"] in [
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ]
+
+
 @router.get("/{contract_id}/download")
-async def download_contract(
+def download_contract(
     contract_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Download original contract file."""
-    contract = db.query(Contract).filter(
+    contract = db.query(Contract).options(
+        load_only(Contract.file_path, Contract.original_filename, Contract.file_hash)
+    ).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
     ).first()
@@ -271,16 +331,22 @@ async def download_contract(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found on disk")
 
+    headers = file_cache_headers(contract.file_hash)
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         path=file_path,
         filename=contract.original_filename,
-        media_type="application/octet-stream"
+        media_type="application/octet-stream",
+        headers=headers,
     )
 
 
 @router.get("/{contract_id}/pdf")
-async def get_contract_pdf(
+def get_contract_pdf(
     contract_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -288,7 +354,15 @@ async def get_contract_pdf(
     - For PDF files: Returns the original file
     - For DOCX files: Converts to PDF and returns it (cached)
     """
-    contract = db.query(Contract).filter(
+    contract = db.query(Contract).options(
+        load_only(
+            Contract.id,
+            Contract.file_path,
+            Contract.file_type,
+            Contract.original_filename,
+            Contract.file_hash,
+        )
+    ).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
     ).first()
@@ -300,12 +374,18 @@ async def get_contract_pdf(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found on disk")
 
+    # The converted PDF is derived from the original, so its hash identifies both
+    headers = file_cache_headers(contract.file_hash)
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
     # If already PDF, return directly
     if contract.file_type.lower() == "pdf":
         return FileResponse(
             path=file_path,
             media_type="application/pdf",
-            filename=f"{Path(contract.original_filename).stem}.pdf"
+            filename=f"{Path(contract.original_filename).stem}.pdf",
+            headers=headers,
         )
 
     # For DOCX/DOC files, convert to PDF
@@ -318,7 +398,8 @@ async def get_contract_pdf(
         return FileResponse(
             path=cached_pdf_path,
             media_type="application/pdf",
-            filename=f"{Path(contract.original_filename).stem}.pdf"
+            filename=f"{Path(contract.original_filename).stem}.pdf",
+            headers=headers,
         )
 
     # Convert DOCX to PDF
@@ -355,12 +436,13 @@ async def get_contract_pdf(
     return FileResponse(
         path=cached_pdf_path,
         media_type="application/pdf",
-        filename=f"{Path(contract.original_filename).stem}.pdf"
+        filename=f"{Path(contract.original_filename).stem}.pdf",
+        headers=headers,
     )
 
 
 @router.get("/{contract_id}", response_model=ContractDetail)
-async def get_contract(
+def get_contract(
     contract_id: str,
     db: Session = Depends(get_db)
 ):
@@ -392,12 +474,12 @@ async def get_contract(
 
 
 @router.delete("/{contract_id}")
-async def delete_contract(
+def delete_contract(
     contract_id: str,
     db: Session = Depends(get_db)
 ):
     """Soft delete a contract."""
-    contract = db.query(Contract).filter(
+    contract = db.query(Contract).options(load_only(Contract.id)).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
     ).first()
@@ -413,9 +495,11 @@ async def delete_contract(
 
 
 @router.post("/backfill-page-counts")
-async def backfill_page_counts(db: Session = Depends(get_db)):
+def backfill_page_counts(db: Session = Depends(get_db)):
     """Recalculate page counts for all existing contracts."""
-    contracts = db.query(Contract).filter(Contract.is_deleted == False).all()
+    contracts = db.query(Contract).options(
+        load_only(Contract.id, Contract.file_path, Contract.page_count)
+    ).filter(Contract.is_deleted == False).all()
 
     updated = 0
     errors = []
@@ -1,16 +1,19 @@
 """Export management endpoints."""
 
-import json
+import asyncio
 import csv
 import io
+import textwrap
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
 
 from backend.api.deps import get_db
@@ -22,7 +25,7 @@ from backend.core.config import STORAGE_DIR
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from src.exporters.excel_exporter import ExcelExporter
-from src.schema import ContractData
+from src.schema import ContractData, Metadata, Territory
 
 router = APIRouter()
 
@@ -30,6 +33,19 @@ router = APIRouter()
 EXPORTS_DIR = STORAGE_DIR / "exports"
 EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# How long a download waits for a background export to finish
+EXPORT_WAIT_SECONDS = 60
+EXPORT_POLL_INTERVAL = 0.25
+
+# Streamed CSV/JSON exports: rows fetched per batch, bytes buffered per chunk
+EXPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# CSV/JSON manifests (.ids) are kept this long so their links can be downloaded
+# again; an Excel .part placeholder this old belongs to a build that died
+EXPORT_MANIFEST_MAX_AGE = 7 * 24 * 3600
+EXPORT_PART_MAX_AGE = 3600
+
 
 class ExportRequest(BaseModel):
     """Request to create an export."""
@@ -45,13 +61,160 @@ class ExportResponse(BaseModel):
     download_url: str
 
 
+def split_states(value: Optional[str]) -> list[str]:
+    """Split a '; '-joined state list from flat extraction data."""
+    return value.split("; ") if value else []
+
+
+def build_export_file(
+    file_path: Path,
+    extraction_ids: list[str],
+):
+    """Background task to write an Excel export file.
+
+    The file is written under a ``.part`` name and renamed once complete, so
+    the download endpoint can tell a finished export from one in progress.
+    """
+    from backend.core.database import SessionLocal
+
+    part_path = file_path.with_name(f"{file_path.name}.part")
+    db = SessionLocal()
+    try:
+        rows = db.query(Extraction, Contract.original_filename).outerjoin(
+            Contract, Contract.id == Extraction.contract_id
+        ).filter(
+            Extraction.id.in_(extraction_ids),
+            Extraction.status == "completed"
+        ).all()
+
+        # Convert to ContractData objects for Excel exporter
+        contracts = []
+        for extraction, contract_filename in rows:
+            # Add document source to extracted data
+            data = extraction.extracted_data or {}
+            if contract_filename is not None:
+                data["document_source"] = contract_filename
+
+            # Create ContractData from flat dict. Only metadata is validated
+            # (effective_date must be parsed to a date); the rest is trusted.
+            contract_data = ContractData.model_construct(
+                metadata=Metadata.model_validate({
+                    "member_name": data.get("member_name"),
+                    "product_name": data.get("product_name"),
+                    "product_description": data.get("product_description"),
+                    "effective_date": data.get("effective_date"),
+                    "document_source": data.get("document_source"),
+                    "extraction_timestamp": extraction.completed_at.isoformat() if extraction.completed_at else None,
+                }),
+                territory=Territory.model_construct(
+                    permitted_states=split_states(data.get("permitted_states")),
+                    excluded_states=split_states(data.get("excluded_states")),
+                    admitted_status=data.get("admitted_status"),
+                ),
+                extraction_notes=extraction.extraction_notes or [],
+            )
+            contracts.append(contract_data)
+
+        # Use existing Excel exporter
+        exporter = ExcelExporter()
+        exporter.export(contracts, part_path)
+
+        part_path.rename(file_path)
+
+    except Exception:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def stream_export_rows(extraction_ids: list[str], export_format: str):
+    """Yield a CSV or JSON export chunk by chunk, fetching rows in batches.
+
+    The CSV header must list every field before the first row is written, so
+    CSV exports read the extracted data twice: once for the field names, in
+    first-seen order, and once for the rows.
+    """
+    from backend.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        completed = (
+            Extraction.id.in_(extraction_ids),
+            Extraction.status == "completed",
+        )
+        rows = db.query(Extraction, Contract.original_filename).outerjoin(
+            Contract, Contract.id == Extraction.contract_id
+        ).filter(*completed).yield_per(EXPORT_BATCH_SIZE)
+
+        if export_format == "csv":
+            # Union of all field names; a dict keeps them unique and ordered
+            fieldnames = {}
+            for (data,) in db.query(Extraction.extracted_data).filter(*completed).yield_per(EXPORT_BATCH_SIZE):
+                fieldnames.update(dict.fromkeys(data or {}))
+
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=list(fieldnames))
+            writer.writeheader()
+            for extraction, _ in rows:
+                writer.writerow(extraction.extracted_data or {})
+                if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue()
+
+        else:  # json
+            yield "["
+            separator = "\n"
+            for extraction, contract_filename in rows:
+                item = orjson.dumps({
+                    "extraction_id": extraction.id,
+                    "contract_id": extraction.contract_id,
+                    "contract_filename": contract_filename,
+                    "model_provider": extraction.model_provider,
+                    "model_name": extraction.model_name,
+                    "extracted_at": extraction.completed_at.isoformat() if extraction.completed_at else None,
+                    "data": extraction.extracted_data or {},
+                }, option=orjson.OPT_INDENT_2, default=str).decode()
+                yield separator + textwrap.indent(item, "  ")
+                separator = ",\n"
+            yield "\n]" if separator != "\n" else "]"
+
+    finally:
+        db.close()
+
+
+def sweep_export_files():
+    """Delete expired CSV/JSON manifests and abandoned Excel placeholders."""
+    now = time.time()
+    for pattern, max_age in (("*.ids", EXPORT_MANIFEST_MAX_AGE), ("*.part", EXPORT_PART_MAX_AGE)):
+        for path in EXPORTS_DIR.glob(pattern):
+            try:
+                if now - path.stat().st_mtime > max_age:
+                    path.unlink()
+            except FileNotFoundError:
+                pass  # removed concurrently, e.g. a finished build renamed it
+
+
 @router.post("/", response_model=ExportResponse)
-async def create_export(
+def create_export(
     request: ExportRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
-    Create an export file from extraction results.
+    Create an export from extraction results.
+
+    Excel files are generated in the background and the download endpoint
+    waits for them to finish. CSV and JSON exports only record the extraction
+    IDs (in a small ``.ids`` manifest, kept for EXPORT_MANIFEST_MAX_AGE so the
+    link can be downloaded again) and are streamed straight from the database
+    when downloaded. Their rows are therefore read at download time: edits
+    made after the export was created are included, and extractions deleted
+    since are left out. Each export sweeps expired manifests and abandoned
+    Excel placeholders in the background.
 
     Supports formats:
     - xlsx: Excel file with formatting
@@ -70,103 +233,45 @@ async def create_export(
             detail="No extraction IDs provided"
         )
 
-    # Fetch extractions
-    extractions = db.query(Extraction).filter(
-        Extraction.id.in_(request.extraction_ids),
-        Extraction.status == "completed"
-    ).all()
+    # Resolve completed extractions
+    extraction_ids = [
+        row.id for row in db.query(Extraction.id).filter(
+            Extraction.id.in_(request.extraction_ids),
+            Extraction.status == "completed"
+        ).all()
+    ]
 
-    if not extractions:
+    if not extraction_ids:
         raise HTTPException(
             status_code=404,
             detail="No completed extractions found"
         )
 
-    # Generate export file
-    export_id = str(uuid4())
+    background_tasks.add_task(sweep_export_files)
+
+    export_id = uuid4().hex
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # The export ID keeps exports created in the same second from sharing files
+    filename = f"extraction_{timestamp}_{export_id[:8]}.{request.format}"
+    file_path = EXPORTS_DIR / filename
 
     if request.format == "xlsx":
-        filename = f"extraction_{timestamp}.xlsx"
-        file_path = EXPORTS_DIR / filename
-
-        # Convert to ContractData objects for Excel exporter
-        contracts = []
-        for extraction in extractions:
-            # Get contract info
-            contract = db.query(Contract).filter(
-                Contract.id == extraction.contract_id
-            ).first()
+        # Create the placeholder synchronously so downloads know the export is pending
+        file_path.with_name(f"{filename}.part").touch()
 
-            # Add document source to extracted data
-            data = extraction.extracted_data or {}
-            if contract:
-                data["document_source"] = contract.original_filename
-
-            # Create ContractData from flat dict
-            contract_data = ContractData.model_validate({
-                "metadata": {
-                    "member_name": data.get("member_name"),
-                    "product_name": data.get("product_name"),
-                    "product_description": data.get("product_description"),
-                    "effective_date": data.get("effective_date"),
-                    "document_source": data.get("document_source"),
-                    "extraction_timestamp": extraction.completed_at.isoformat() if extraction.completed_at else None,
-                },
-                "territory": {
-                    "permitted_states": data.get("permitted_states", "").split("; ") if data.get("permitted_states") else [],
-                    "excluded_states": data.get("excluded_states", "").split("; ") if data.get("excluded_states") else [],
-                    "admitted_status": data.get("admitted_status"),
-                },
-                "extraction_notes": extraction.extraction_notes or [],
-            })
-            contracts.append(contract_data)
-
-        # Use existing Excel exporter
-        exporter = ExcelExporter()
-        exporter.export(contracts, file_path)
-
-    elif request.format == "csv":
-        filename = f"extraction_{timestamp}.csv"
-        file_path = EXPORTS_DIR / filename
-
-        # Get all field names from first extraction
-        if extractions:
-            fieldnames = list(extractions[0].extracted_data.keys()) if extractions[0].extracted_data else []
-
-            with open(file_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for extraction in extractions:
-                    writer.writerow(extraction.extracted_data or {})
-
-    else:  # json
-        filename = f"extraction_{timestamp}.json"
-        file_path = EXPORTS_DIR / filename
-
-        export_data = []
-        for extraction in extractions:
-            contract = db.query(Contract).filter(
-                Contract.id == extraction.contract_id
-            ).first()
-
-            export_data.append({
-                "extraction_id": extraction.id,
-                "contract_id": extraction.contract_id,
-                "contract_filename": contract.original_filename if contract else None,
-                "model_provider": extraction.model_provider,
-                "model_name": extraction.model_name,
-                "extracted_at": extraction.completed_at.isoformat() if extraction.completed_at else None,
-                "data": extraction.extracted_data or {},
-            })
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, default=str)
+        background_tasks.add_task(
+            build_export_file,
+            file_path=file_path,
+            extraction_ids=extraction_ids,
+        )
+    else:
+        # Only the extraction IDs are stored; rows are streamed on download
+        file_path.with_name(f"{filename}.ids").write_bytes(orjson.dumps(extraction_ids))
 
     return ExportResponse(
         export_id=export_id,
         format=request.format,
-        extraction_count=len(extractions),
+        extraction_count=len(extraction_ids),
         download_url=f"/api/exports/{filename}/download",
     )
 
@@ -175,11 +280,14 @@ async def create_export(
 async def download_export(
     filename: str,
 ):
-    """Download generated export file."""
-    file_path = EXPORTS_DIR / filename
+    """Download an export, streaming CSV/JSON and waiting on pending Excel files.
 
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Export file not found")
+    CSV and JSON exports hold the extractions' current data, read as they are
+    streamed, not a snapshot from when the export was created.
+    """
+    file_path = EXPORTS_DIR / filename
+    part_path = EXPORTS_DIR / f"{filename}.part"
+    ids_path = EXPORTS_DIR / f"{filename}.ids"
 
     # Determine media type
     if filename.endswith(".xlsx"):
@@ -189,6 +297,29 @@ async def download_export(
     else:
         media_type = "application/json"
 
+    if ids_path.exists():
+        extraction_ids = orjson.loads(ids_path.read_bytes())
+        return StreamingResponse(
+            stream_export_rows(extraction_ids, "csv" if filename.endswith(".csv") else "json"),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    # Poll without holding a worker thread while the background task runs
+    waited = 0.0
+    while part_path.exists() and not file_path.exists():
+        if waited >= EXPORT_WAIT_SECONDS:
+            raise HTTPException(
+                status_code=425,
+                detail="Export is still being generated",
+                headers={"Retry-After": "5"},
+            )
+        await asyncio.sleep(EXPORT_POLL_INTERVAL)
+        waited += EXPORT_POLL_INTERVAL
+
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="Export file not found")
+
     return FileResponse(
         path=file_path,
         filename=filename,
@@ -197,13 +328,15 @@ async def download_export(
 
 
 @router.get("/{extraction_id}/quick-export")
-async def quick_export_extraction(
+def quick_export_extraction(
     extraction_id: str,
     format: str = Query("json", description="Export format: json, csv"),
     db: Session = Depends(get_db)
 ):
     """Quick export a single extraction without creating a file."""
-    extraction = db.query(Extraction).filter(
+    extraction = db.query(Extraction).options(
+        joinedload(Extraction.contract).load_only(Contract.original_filename)
+    ).filter(
         Extraction.id == extraction_id,
         Extraction.status == "completed"
     ).first()
@@ -211,18 +344,20 @@ async def quick_export_extraction(
     if not extraction:
         raise HTTPException(status_code=404, detail="Extraction not found")
 
-    contract = db.query(Contract).filter(
-        Contract.id == extraction.contract_id
-    ).first()
+    contract = extraction.contract
 
     if format == "json":
-        return {
-            "extraction_id": extraction.id,
-            "contract_filename": contract.original_filename if contract else None,
-            "model": f"{extraction.model_provider}/{extraction.model_name}",
-            "extracted_at": extraction.completed_at,
-            "data": extraction.extracted_data or {},
-        }
+        # No response model here, so serialize with orjson rather than jsonable_encoder
+        return Response(
+            content=orjson.dumps({
+                "extraction_id": extraction.id,
+                "contract_filename": contract.original_filename if contract else None,
+                "model": f"{extraction.model_provider}/{extraction.model_name}",
+                "extracted_at": extraction.completed_at,
+                "data": extraction.extracted_data or {},
+            }, default=str),
+            media_type="application/json",
+        )
 
     elif format == "csv":
         output = io.StringIO()
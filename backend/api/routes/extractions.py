@@ -1,16 +1,21 @@
 """Extraction management endpoints."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import String, insert, literal, select, update
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 
 from backend.api.deps import get_db
+from backend.core.cache import TTLCache
+from backend.core.config import EXTRACTION_WORKERS
+from backend.core.database import json_merge, json_merge_supported
 from backend.models.contract import Contract
-from backend.models.extraction import Extraction
+from backend.models.extraction import Extraction, generate_uuid
 from backend.schemas.extraction import (
     ExtractionRequest,
     ExtractionResponse,
@@ -28,14 +33,37 @@ from src.schema import ContractData
 
 router = APIRouter()
 
+# Total schema columns, the denominator for fields_extracted on every job
+FLAT_COLUMN_COUNT = len(ContractData.get_flat_columns())
+
+# Long-running LLM extractions get their own workers so they never occupy the
+# threadpool that serves sync API requests
+extraction_executor = ThreadPoolExecutor(
+    max_workers=EXTRACTION_WORKERS,
+    thread_name_prefix="extraction",
+)
+
+
+@lru_cache(maxsize=16)
+def cached_extractor(model_provider: str, model_name: Optional[str]):
+    """Extractor per provider/model, reused across jobs to keep SDK clients warm."""
+    if model_provider == "landing_ai":
+        return get_extractor("landing_ai")
+    return get_extractor("llm", provider=model_provider, model=model_name)
+
+
+# Status poll cache: terminal statuses never change and are kept until evicted,
+# in-flight ones are served for a couple of seconds between DB reads
+STATUS_CACHE_TTL = 2.0
+STATUS_CACHE_SIZE = 10_000
+_status_cache: TTLCache[ExtractionStatus] = TTLCache(STATUS_CACHE_TTL, STATUS_CACHE_SIZE)
+
 
 def run_extraction_task(
     extraction_id: str,
     contract_id: str,
     model_provider: str,
     model_name: str,
-    document_path: str,
-    document_text: str,
 ):
     """Background task to run extraction."""
     from backend.core.database import SessionLocal
@@ -47,25 +75,23 @@ def run_extraction_task(
         if not extraction:
             return
 
+        # Document text is loaded here rather than passed in by the request
+        document = db.query(Contract.file_path, Contract.extracted_text).filter(
+            Contract.id == contract_id
+        ).first()
+
         extraction.status = "processing"
         extraction.started_at = datetime.utcnow()
         db.commit()
+        _status_cache.pop(extraction_id)
 
         try:
-            # Initialize extractor
-            if model_provider == "landing_ai":
-                extractor = get_extractor("landing_ai")
-            else:
-                extractor = get_extractor(
-                    "llm",
-                    provider=model_provider,
-                    model=model_name
-                )
+            extractor = cached_extractor(model_provider, model_name)
 
             # Run extraction
             result: ContractData = extractor.extract(
-                document_path=document_path,
-                document_text=document_text
+                document_path=document.file_path,
+                document_text=document.extracted_text
             )
 
             # Count extracted fields
@@ -74,14 +100,13 @@ def run_extraction_task(
                 1 for v in flat_data.values()
                 if v is not None and v != "" and v != []
             )
-            fields_total = len(ContractData.get_flat_columns())
 
             # Update extraction record
             extraction.extracted_data = flat_data
             extraction.status = "completed"
             extraction.completed_at = datetime.utcnow()
             extraction.fields_extracted = fields_extracted
-            extraction.fields_total = fields_total
+            extraction.fields_total = FLAT_COLUMN_COUNT
             extraction.extraction_notes = result.extraction_notes
 
         except Exception as e:
@@ -90,68 +115,81 @@ def run_extraction_task(
             extraction.completed_at = datetime.utcnow()
 
         db.commit()
+        _status_cache.pop(extraction_id)
 
     finally:
         db.close()
 
 
+def extraction_result(extraction) -> ExtractionResult:
+    """Full extraction response from an Extraction row or matching result row."""
+    return ExtractionResult(
+        id=extraction.id,
+        contract_id=extraction.contract_id,
+        version_id=extraction.version_id,
+        model_provider=extraction.model_provider,
+        model_name=extraction.model_name,
+        status=extraction.status,
+        started_at=extraction.started_at,
+        completed_at=extraction.completed_at,
+        error_message=extraction.error_message,
+        extracted_data=extraction.extracted_data or {},
+        fields_extracted=extraction.fields_extracted,
+        fields_total=extraction.fields_total,
+        extraction_notes=extraction.extraction_notes or [],
+        created_at=extraction.created_at,
+    )
+
+
 @router.post("/", response_model=ExtractionResponse)
-async def start_extraction(
+def start_extraction(
     request: ExtractionRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Start an extraction job for a contract.
 
     - Creates extraction record with status 'pending'
-    - Queues background task
+    - Queues the job on the extraction worker pool
     - Returns extraction ID for status polling
     """
-    # Verify contract exists
-    contract = db.query(Contract).filter(
-        Contract.id == request.contract_id,
-        Contract.is_deleted == False
-    ).first()
-
-    if not contract:
-        raise HTTPException(status_code=404, detail="Contract not found")
-
-    # Validate provider
-    valid_providers = {"anthropic", "openai", "landing_ai"}
-    if request.model_provider not in valid_providers:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid provider. Valid options: {', '.join(valid_providers)}"
+    # Create the extraction record only if the contract exists and is live,
+    # checked and inserted in one statement
+    extraction_id = generate_uuid()
+    result = db.execute(
+        insert(Extraction).from_select(
+            ["id", "contract_id", "version_id", "model_provider", "model_name", "status"],
+            select(
+                literal(extraction_id),
+                Contract.id,
+                literal(request.version_id, String),
+                literal(request.model_provider),
+                literal(request.model_name),
+                literal("pending"),
+            ).where(
+                Contract.id == request.contract_id,
+                Contract.is_deleted == False
+            ),
         )
-
-    # Create extraction record
-    extraction = Extraction(
-        contract_id=request.contract_id,
-        version_id=request.version_id,
-        model_provider=request.model_provider,
-        model_name=request.model_name,
-        status="pending",
     )
 
-    db.add(extraction)
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Contract not found")
+
     db.commit()
-    db.refresh(extraction)
 
-    # Queue background task
-    background_tasks.add_task(
+    # Queue extraction job
+    extraction_executor.submit(
         run_extraction_task,
-        extraction_id=extraction.id,
-        contract_id=contract.id,
+        extraction_id=extraction_id,
+        contract_id=request.contract_id,
         model_provider=request.model_provider,
         model_name=request.model_name,
-        document_path=contract.file_path,
-        document_text=contract.extracted_text,
     )
 
     return ExtractionResponse(
-        extraction_id=extraction.id,
-        contract_id=contract.id,
+        extraction_id=extraction_id,
+        contract_id=request.contract_id,
         status="pending",
         model_provider=request.model_provider,
         model_name=request.model_name,
@@ -160,7 +198,7 @@ async def start_extraction(
 
 
 @router.get("/{extraction_id}", response_model=ExtractionResult)
-async def get_extraction(
+def get_extraction(
     extraction_id: str,
     db: Session = Depends(get_db)
 ):
@@ -170,30 +208,19 @@ async def get_extraction(
     if not extraction:
         raise HTTPException(status_code=404, detail="Extraction not found")
 
-    return ExtractionResult(
-        id=extraction.id,
-        contract_id=extraction.contract_id,
-        version_id=extraction.version_id,
-        model_provider=extraction.model_provider,
-        model_name=extraction.model_name,
-        status=extraction.status,
-        started_at=extraction.started_at,
-        completed_at=extraction.completed_at,
-        error_message=extraction.error_message,
-        extracted_data=extraction.extracted_data or {},
-        fields_extracted=extraction.fields_extracted,
-        fields_total=extraction.fields_total,
-        extraction_notes=extraction.extraction_notes or [],
-        created_at=extraction.created_at,
-    )
+    return extraction_result(extraction)
 
 
 @router.get("/{extraction_id}/status", response_model=ExtractionStatus)
-async def get_extraction_status(
+def get_extraction_status(
     extraction_id: str,
     db: Session = Depends(get_db)
 ):
     """Get extraction job status for polling."""
+    cached = _status_cache.get(extraction_id)
+    if cached is not None:
+        return cached
+
     extraction = db.query(Extraction).filter(Extraction.id == extraction_id).first()
 
     if not extraction:
@@ -208,7 +235,7 @@ async def get_extraction_status(
     elif extraction.status in ("completed", "failed"):
         progress = 100
 
-    return ExtractionStatus(
+    status = ExtractionStatus(
         extraction_id=extraction.id,
         status=extraction.status,
         started_at=extraction.started_at,
@@ -216,31 +243,37 @@ async def get_extraction_status(
         error_message=extraction.error_message,
         progress_percent=progress,
     )
+    # A finished job's status never changes, so it is kept until evicted
+    terminal = status.status in ("completed", "failed")
+    _status_cache.set(status.extraction_id, status, expires=not terminal)
+    return status
 
 
 @router.get("/contract/{contract_id}", response_model=list[ExtractionSummary])
-async def list_contract_extractions(
+def list_contract_extractions(
     contract_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
-    """List all extractions for a contract."""
-    contract = db.query(Contract).filter(
+    """List extractions for a contract, newest first."""
+    contract_filename = db.query(Contract.original_filename).filter(
         Contract.id == contract_id,
         Contract.is_deleted == False
-    ).first()
+    ).scalar()
 
-    if not contract:
+    if contract_filename is None:
         raise HTTPException(status_code=404, detail="Contract not found")
 
     extractions = db.query(Extraction).filter(
         Extraction.contract_id == contract_id
-    ).order_by(Extraction.created_at.desc()).all()
+    ).order_by(Extraction.created_at.desc()).offset(skip).limit(limit).all()
 
     return [
         ExtractionSummary(
             id=e.id,
             contract_id=e.contract_id,
-            contract_filename=contract.original_filename,
+            contract_filename=contract_filename,
             model_provider=e.model_provider,
             model_name=e.model_name,
             status=e.status,
@@ -258,12 +291,59 @@ async def list_contract_extractions(
 
 
 @router.patch("/{extraction_id}", response_model=ExtractionResult)
-async def update_extraction(
+def update_extraction(
     extraction_id: str,
     updates: ExtractionUpdate,
     db: Session = Depends(get_db)
 ):
     """Update extracted fields (manual corrections)."""
+    if not json_merge_supported(db.get_bind(), updates.extracted_data):
+        return update_extraction_in_python(db, extraction_id, updates.extracted_data)
+
+    # Merge the corrections into the stored JSON in a single UPDATE
+    row = db.execute(
+        update(Extraction).where(
+            Extraction.id == extraction_id,
+            Extraction.status == "completed",
+        ).values(
+            extracted_data=json_merge(Extraction.extracted_data, updates.extracted_data),
+            updated_at=datetime.utcnow(),
+        ).returning(
+            Extraction.id,
+            Extraction.contract_id,
+            Extraction.version_id,
+            Extraction.model_provider,
+            Extraction.model_name,
+            Extraction.status,
+            Extraction.started_at,
+            Extraction.completed_at,
+            Extraction.error_message,
+            Extraction.extracted_data,
+            Extraction.fields_extracted,
+            Extraction.fields_total,
+            Extraction.extraction_notes,
+            Extraction.created_at,
+        ).execution_options(synchronize_session=False)
+    ).first()
+
+    if row is None:
+        exists = db.query(
+            db.query(Extraction.id).filter(Extraction.id == extraction_id).exists()
+        ).scalar()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Extraction not found")
+        raise HTTPException(
+            status_code=400,
+            detail="Can only update completed extractions"
+        )
+
+    db.commit()
+
+    return extraction_result(row)
+
+
+def update_extraction_in_python(db: Session, extraction_id: str, patch: dict) -> ExtractionResult:
+    """Merge corrections by loading and rewriting the row, for patches json_merge cannot express."""
     extraction = db.query(Extraction).filter(Extraction.id == extraction_id).first()
 
     if not extraction:
@@ -275,61 +355,37 @@ async def update_extraction(
             detail="Can only update completed extractions"
         )
 
-    # Merge updates (explicitly flag as modified for SQLAlchemy)
-    current_data = dict(extraction.extracted_data or {})
-    current_data.update(updates.extracted_data)
-    extraction.extracted_data = current_data
-    flag_modified(extraction, "extracted_data")  # Force SQLAlchemy to detect change
+    extraction.extracted_data = {**(extraction.extracted_data or {}), **patch}
     extraction.updated_at = datetime.utcnow()
-
-    # Explicit flush then commit to ensure data is written
-    db.flush()
     db.commit()
-
-    # Clear session cache and refresh
-    db.expire_all()
     db.refresh(extraction)
 
-    return ExtractionResult(
-        id=extraction.id,
-        contract_id=extraction.contract_id,
-        version_id=extraction.version_id,
-        model_provider=extraction.model_provider,
-        model_name=extraction.model_name,
-        status=extraction.status,
-        started_at=extraction.started_at,
-        completed_at=extraction.completed_at,
-        error_message=extraction.error_message,
-        extracted_data=extraction.extracted_data or {},
-        fields_extracted=extraction.fields_extracted,
-        fields_total=extraction.fields_total,
-        extraction_notes=extraction.extraction_notes or [],
-        created_at=extraction.created_at,
-    )
+    return extraction_result(extraction)
 
 
 @router.get("/", response_model=list[ExtractionSummary])
-async def list_extractions(
+def list_extractions(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     status: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """List all extractions with filtering."""
-    query = db.query(Extraction)
+    query = db.query(Extraction, Contract.original_filename).outerjoin(
+        Contract, Contract.id == Extraction.contract_id
+    )
 
     if status:
         query = query.filter(Extraction.status == status)
 
-    extractions = query.order_by(Extraction.created_at.desc()).offset(skip).limit(limit).all()
+    rows = query.order_by(Extraction.created_at.desc()).offset(skip).limit(limit).all()
 
     result = []
-    for e in extractions:
-        contract = db.query(Contract).filter(Contract.id == e.contract_id).first()
+    for e, contract_filename in rows:
         result.append(ExtractionSummary(
             id=e.id,
             contract_id=e.contract_id,
-            contract_filename=contract.original_filename if contract else None,
+            contract_filename=contract_filename,
             model_provider=e.model_provider,
             model_name=e.model_name,
             status=e.status,
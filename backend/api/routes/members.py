@@ -1,12 +1,28 @@
 """Members API routes."""
 
+import asyncio
+import hashlib
+import logging
+import math
+import re
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Boolean, Date, String, Text, cast, event, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from backend.api.deps import get_db
+from backend.core.cache import TTLCache
+from backend.core.config import LLM_MAX_IN_FLIGHT, LLM_REQUESTS_PER_MINUTE, PRODUCT_ANALYSIS_CONCURRENCY
 from backend.models.member import (
     Member,
     GWPBreakdown,
@@ -51,6 +67,79 @@ from backend.services.member_import import import_from_excel, get_member_gwp_tre
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# Dimension relationships of a GWP breakdown, eager-loaded wherever their names are read
+GWP_DIMENSIONS = (
+    GWPBreakdown.line_of_business,
+    GWPBreakdown.class_of_business,
+    GWPBreakdown.product,
+    GWPBreakdown.sub_product,
+    GWPBreakdown.member_product_program,
+)
+
+
+def _find_member(db: Session, key: str) -> Optional[Member]:
+    """Look up a member by UUID or member_id code in one query, preferring the UUID."""
+    return db.query(Member).filter(
+        (Member.id == key) | (Member.member_id == key)
+    ).order_by((Member.id == key).desc()).first()
+
+
+@lru_cache(maxsize=None)
+def async_llm_client(model_provider: str):
+    """Async SDK client per provider, shared so its connection pool is reused."""
+    if model_provider == "anthropic":
+        import anthropic
+        from config.settings import ANTHROPIC_API_KEY
+
+        return anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+
+    import openai
+    from config.settings import OPENAI_API_KEY
+
+    return openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+
+class RequestLimiter:
+    """Async context manager capping calls in flight and calls started per minute.
+
+    Callers over either limit wait here rather than being rejected by the
+    provider with a 429; the SDK's own retries still cover any that slip through.
+    """
+
+    def __init__(self, max_in_flight: int, per_minute: int):
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._per_minute = per_minute
+        self._started: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self._in_flight.acquire()
+        try:
+            # Waiters queue on the lock, so start slots are handed out in order
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    while self._started and self._started[0] <= now - 60:
+                        self._started.popleft()
+                    if len(self._started) < self._per_minute:
+                        break
+                    await asyncio.sleep(self._started[0] + 60 - now)
+                self._started.append(now)
+        except BaseException:
+            self._in_flight.release()
+            raise
+
+    async def __aexit__(self, *exc_info):
+        self._in_flight.release()
+
+
+@lru_cache(maxsize=None)
+def llm_limiter(model_provider: str) -> RequestLimiter:
+    """Shared limiter per provider for interactive LLM calls."""
+    return RequestLimiter(LLM_MAX_IN_FLIGHT, LLM_REQUESTS_PER_MINUTE)
+
 
 # =============================================================================
 # STATS ENDPOINT
@@ -89,38 +178,43 @@ def list_members(
             (Member.member_id.ilike(search_term))
         )
 
-    # Get total count
-    total = query.count()
-
-    # Get paginated results
-    members = query.order_by(Member.name).offset(skip).limit(limit).all()
-
-    # Build response with computed stats
-    member_items = []
-    for m in members:
-        # Calculate total GWP
-        gwp_sum = db.query(func.sum(GWPBreakdown.total_gwp)).filter(
-            GWPBreakdown.member_id == m.id
-        ).scalar() or Decimal("0")
-
-        # Count GWP rows
-        gwp_count = db.query(GWPBreakdown).filter(
-            GWPBreakdown.member_id == m.id
-        ).count()
-
-        # Count contracts
-        contract_count = db.query(MemberContract).filter(
-            MemberContract.member_id == m.id
-        ).count()
-
-        member_items.append(MemberListItem(
+    # GWP totals and contract counts per member, joined into the page query
+    gwp_stats = db.query(
+        GWPBreakdown.member_id,
+        func.sum(GWPBreakdown.total_gwp).label("total_gwp"),
+        func.count(GWPBreakdown.id).label("gwp_row_count"),
+    ).group_by(GWPBreakdown.member_id).subquery()
+
+    contract_counts = db.query(
+        MemberContract.member_id,
+        func.count(MemberContract.id).label("contract_count"),
+    ).group_by(MemberContract.member_id).subquery()
+
+    rows = query.outerjoin(
+        gwp_stats, gwp_stats.c.member_id == Member.id
+    ).outerjoin(
+        contract_counts, contract_counts.c.member_id == Member.id
+    ).add_columns(
+        gwp_stats.c.total_gwp,
+        func.coalesce(gwp_stats.c.gwp_row_count, 0),
+        func.coalesce(contract_counts.c.contract_count, 0),
+        func.count().over().label("total"),
+    ).order_by(Member.name).offset(skip).limit(limit).all()
+
+    # Total rides along on each page row; fall back to COUNT past the last page
+    total = rows[0].total if rows else (query.count() if skip else 0)
+
+    member_items = [
+        MemberListItem(
             id=m.id,
             member_id=m.member_id,
             name=m.name,
-            total_gwp=gwp_sum,
+            total_gwp=gwp_sum or Decimal("0"),
             gwp_row_count=gwp_count,
             contract_count=contract_count,
-        ))
+        )
+        for m, gwp_sum, gwp_count, contract_count, _ in rows
+    ]
 
     return MemberListResponse(
         members=member_items,
@@ -133,27 +227,36 @@ def list_members(
 @router.get("/by-contract/{contract_id}")
 def get_members_for_contract(
     contract_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
 ):
-    """Get all members linked to a contract."""
-    member_contracts = db.query(MemberContract).filter(
+    """Get members linked to a contract."""
+    query = db.query(MemberContract, Member).join(
+        Member, Member.id == MemberContract.member_id
+    ).filter(
         MemberContract.contract_id == contract_id
-    ).all()
+    )
+
+    rows = query.add_columns(
+        func.count().over().label("total")
+    ).order_by(MemberContract.created_at).offset(skip).limit(limit).all()
+
+    # Total rides along on each page row; fall back to COUNT past the last page
+    total = rows[0].total if rows else (query.count() if skip else 0)
 
     members = []
-    for mc in member_contracts:
-        member = db.query(Member).filter(Member.id == mc.member_id).first()
-        if member:
-            members.append({
-                "id": str(member.id),
-                "member_id": member.member_id,
-                "name": member.name,
-                "link_id": str(mc.id),
-                "version_number": mc.version_number,
-                "is_current": mc.is_current,
-            })
+    for mc, member, _ in rows:
+        members.append({
+            "id": str(member.id),
+            "member_id": member.member_id,
+            "name": member.name,
+            "link_id": str(mc.id),
+            "version_number": mc.version_number,
+            "is_current": mc.is_current,
+        })
 
-    return {"members": members, "total": len(members)}
+    return {"members": members, "total": total}
 
 
 @router.get("/{member_id}", response_model=MemberDetail)
@@ -162,28 +265,23 @@ def get_member(
     db: Session = Depends(get_db),
 ):
     """Get member details by UUID or member_id code."""
-    # Try UUID first, then member_id code
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    # Look up by UUID or member_id code
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
 
-    # Calculate stats
-    gwp_sum = db.query(func.sum(GWPBreakdown.total_gwp)).filter(
-        GWPBreakdown.member_id == member.id
-    ).scalar() or Decimal("0")
-
-    gwp_count = db.query(GWPBreakdown).filter(
-        GWPBreakdown.member_id == member.id
-    ).count()
-
     # Get GWP breakdowns with joined dimensions
-    breakdowns = db.query(GWPBreakdown).filter(
+    breakdowns = db.query(GWPBreakdown).options(
+        *(joinedload(dimension) for dimension in GWP_DIMENSIONS)
+    ).filter(
         GWPBreakdown.member_id == member.id
     ).all()
 
+    # Stats come from the rows already loaded
+    gwp_sum = sum((b.total_gwp for b in breakdowns), Decimal("0"))
+    gwp_count = len(breakdowns)
+
     return MemberDetail(
         id=member.id,
         member_id=member.member_id,
@@ -202,10 +300,8 @@ def get_member_gwp_tree_endpoint(
     db: Session = Depends(get_db),
 ):
     """Get hierarchical GWP tree for a member."""
-    # Try UUID first, then member_id code
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    # Look up by UUID or member_id code
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -225,21 +321,22 @@ def list_member_contracts(
 ):
     """List all contracts linked to a member."""
     # Find member
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
 
     # Get contracts with joined contract info
-    member_contracts = db.query(MemberContract).filter(
+    rows = db.query(
+        MemberContract, Contract.original_filename, Contract.file_type
+    ).outerjoin(
+        Contract, Contract.id == MemberContract.contract_id
+    ).filter(
         MemberContract.member_id == member.id
     ).order_by(MemberContract.created_at.desc()).all()
 
     contracts = []
-    for mc in member_contracts:
-        contract = db.query(Contract).filter(Contract.id == mc.contract_id).first()
+    for mc, contract_filename, contract_file_type in rows:
         contracts.append(MemberContractResponse(
             id=mc.id,
             member_id=mc.member_id,
@@ -248,8 +345,8 @@ def list_member_contracts(
             is_current=mc.is_current,
             effective_date=mc.effective_date,
             created_at=mc.created_at,
-            contract_filename=contract.original_filename if contract else None,
-            contract_file_type=contract.file_type if contract else None,
+            contract_filename=contract_filename,
+            contract_file_type=contract_file_type,
         ))
 
     return MemberContractListResponse(
@@ -266,58 +363,67 @@ def link_contract_to_member(
 ):
     """Link a contract to a member."""
     # Find member
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
 
     # Verify contract exists
-    contract = db.query(Contract).filter(Contract.id == data.contract_id).first()
+    contract = db.query(Contract.original_filename, Contract.file_type).filter(
+        Contract.id == data.contract_id
+    ).first()
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
 
-    # Check if this member-contract link already exists
-    existing = db.query(MemberContract).filter(
-        MemberContract.member_id == member.id,
-        MemberContract.contract_id == data.contract_id,
+    link_columns = (
+        MemberContract.id,
+        MemberContract.member_id,
+        MemberContract.contract_id,
+        MemberContract.version_number,
+        MemberContract.is_current,
+        MemberContract.effective_date,
+        MemberContract.created_at,
+    )
+
+    # Insert the link only if this member-contract pair is not linked yet, in one
+    # statement. This narrows but does not close the race: member_contracts has no
+    # unique (member_id, contract_id) constraint (new versions may repeat a pair),
+    # so two concurrent requests can both pass the NOT EXISTS check and both insert
+    row = db.execute(
+        insert(MemberContract).from_select(
+            ["member_id", "contract_id", "version_number", "effective_date", "is_current"],
+            select(
+                literal(member.id, String),
+                literal(data.contract_id, String),
+                literal(data.version_number or "v1", String),
+                literal(data.effective_date, Date),
+                literal(True, Boolean),
+            ).where(
+                ~select(MemberContract.id).where(
+                    MemberContract.member_id == member.id,
+                    MemberContract.contract_id == data.contract_id,
+                ).exists()
+            ),
+        ).returning(*link_columns)
     ).first()
 
-    if existing:
+    if row is None:
         # Return the existing link instead of creating a duplicate
-        return MemberContractResponse(
-            id=existing.id,
-            member_id=existing.member_id,
-            contract_id=existing.contract_id,
-            version_number=existing.version_number,
-            is_current=existing.is_current,
-            effective_date=existing.effective_date,
-            created_at=existing.created_at,
-            contract_filename=contract.original_filename,
-            contract_file_type=contract.file_type,
-        )
+        row = db.query(*link_columns).filter(
+            MemberContract.member_id == member.id,
+            MemberContract.contract_id == data.contract_id,
+        ).first()
 
-    # Create new member-contract link
-    member_contract = MemberContract(
-        member_id=member.id,
-        contract_id=data.contract_id,
-        version_number=data.version_number or "v1",
-        effective_date=data.effective_date,
-        is_current=True,
-    )
-    db.add(member_contract)
     db.commit()
-    db.refresh(member_contract)
 
     return MemberContractResponse(
-        id=member_contract.id,
-        member_id=member_contract.member_id,
-        contract_id=member_contract.contract_id,
-        version_number=member_contract.version_number,
-        is_current=member_contract.is_current,
-        effective_date=member_contract.effective_date,
-        created_at=member_contract.created_at,
+        id=row.id,
+        member_id=row.member_id,
+        contract_id=row.contract_id,
+        version_number=row.version_number,
+        is_current=row.is_current,
+        effective_date=row.effective_date,
+        created_at=row.created_at,
         contract_filename=contract.original_filename,
         contract_file_type=contract.file_type,
     )
@@ -331,9 +437,7 @@ def unlink_contract_from_member(
 ):
     """Unlink a contract from a member."""
     # Find member
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -363,31 +467,49 @@ def create_new_contract_version(
 ):
     """Create a new version of a member's contract."""
     # Find member
-    member = db.query(Member).filter(Member.id == member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    member = _find_member(db, member_id)
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
 
     # Verify new contract exists
-    new_contract = db.query(Contract).filter(Contract.id == new_contract_id).first()
+    new_contract = db.query(Contract.original_filename, Contract.file_type).filter(
+        Contract.id == new_contract_id
+    ).first()
     if not new_contract:
         raise HTTPException(status_code=404, detail="New contract not found")
 
-    # Get current version number
-    current = db.query(MemberContract).filter(
-        MemberContract.member_id == member.id,
-        MemberContract.contract_id == contract_id,
-        MemberContract.is_current == True,
-    ).first()
-
-    if current:
-        # Parse version number and increment
-        current_num = int(current.version_number.replace("v", ""))
-        new_version = f"v{current_num + 1}"
-        current.is_current = False
+    # Retire the current version and read its number in one statement. A
+    # concurrent bump that retired it first leaves nothing for this one to match
+    current_version = db.execute(
+        update(MemberContract).where(
+            MemberContract.member_id == member.id,
+            MemberContract.contract_id == contract_id,
+            MemberContract.is_current == True,
+        ).values(
+            is_current=False
+        ).returning(
+            MemberContract.version_number
+        ).execution_options(synchronize_session=False)
+    ).scalar()
+
+    if current_version:
+        new_version = f"v{int(current_version.lstrip('v')) + 1}"
     else:
+        # Earlier versions without a current one mean it was already superseded,
+        # possibly by a concurrent request; numbering this one v1 would be wrong
+        superseded = db.query(
+            db.query(MemberContract.id).filter(
+                MemberContract.member_id == member.id,
+                MemberContract.contract_id == contract_id,
+            ).exists()
+        ).scalar()
+        if superseded:
+            db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="This contract is no longer the member's current version"
+            )
         new_version = "v1"
 
     # Create new version
@@ -404,10 +526,10 @@ def create_new_contract_version(
         is_current=True,
     )
     db.add(member_contract)
-    db.commit()
-    db.refresh(member_contract)
+    db.flush()
 
-    return MemberContractResponse(
+    # Build the response before commit expires the instances (saves reloading them)
+    response = MemberContractResponse(
         id=member_contract.id,
         member_id=member_contract.member_id,
         contract_id=member_contract.contract_id,
@@ -418,6 +540,9 @@ def create_new_contract_version(
         contract_filename=new_contract.original_filename,
         contract_file_type=new_contract.file_type,
     )
+    db.commit()
+
+    return response
 
 
 # =============================================================================
@@ -450,7 +575,7 @@ def create_term_mapping(
 ):
     """Create a term mapping between an extraction field and GWP row."""
     # Verify GWP breakdown exists
-    gwp = db.query(GWPBreakdown).filter(GWPBreakdown.id == data.gwp_breakdown_id).first()
+    gwp = db.get(GWPBreakdown, data.gwp_breakdown_id)
     if not gwp:
         raise HTTPException(status_code=404, detail="GWP breakdown not found")
 
@@ -496,42 +621,54 @@ def get_term_mappings_for_gwp(
 # AI MAPPING SUGGESTIONS ENDPOINT
 # =============================================================================
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
-import json
 
 class SuggestMappingsRequest(BaseModel):
     extraction_id: str
     member_id: str
-    model_provider: str = "anthropic"  # anthropic, openai, or landingai
+    model_provider: str | List[str] = "anthropic"  # anthropic, openai, or landingai; several are merged
     extracted_fields: List[dict]  # [{path: str, value: str}]
     product_combinations: List[dict]  # [{id, cob, lob, product, sub_product, mpp, total_gwp}]
 
 class MappingSuggestion(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     field_path: str
     gwp_breakdown_id: str
     confidence: float  # 0-1
     reason: str
 
-@router.post("/term-mappings/suggest")
-def suggest_term_mappings(
-    request: SuggestMappingsRequest,
-    db: Session = Depends(get_db),
-):
-    """Use AI to suggest mappings between extraction fields and product combinations."""
+class MappingSuggestionList(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    suggestions: List[MappingSuggestion]
+
+class TaskMappingSuggestions(BaseModel):
+    model_config = ConfigDict(extra="forbid")
 
-    # Build prompt for AI
-    fields_text = "\n".join([
-        f"- {f['path']}: {f['value'][:100]}..." if len(str(f.get('value', ''))) > 100 else f"- {f['path']}: {f['value']}"
-        for f in request.extracted_fields
-    ])
+    task_id: str
+    suggestions: List[MappingSuggestion]
 
-    products_text = "\n".join([
-        f"- ID: {p['id']} | {p.get('lob', {}).get('name', 'N/A')} > {p.get('cob', {}).get('name', 'N/A')} > {p.get('product', {}).get('name', 'N/A')} > {p.get('sub_product', {}).get('name', 'N/A')} > {p.get('mpp', {}).get('name', 'N/A')} (GWP: ${p.get('total_gwp', 0)})"
-        for p in request.product_combinations[:50]  # Limit to 50 products
-    ])
+class TaskMappingSuggestionsList(BaseModel):
+    model_config = ConfigDict(extra="forbid")
 
-    system_prompt = """You are an expert insurance underwriter assistant. Your task is to suggest mappings between extracted contract fields and product combinations.
+    tasks: List[TaskMappingSuggestions]
+
+class SuggestedProduct(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    gwp_breakdown_id: str
+    confidence: float  # 0-1
+    reason: str
+
+class SuggestedProductList(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    suggestions: List[SuggestedProduct]
+
+# Prompt text is fixed; only the field and product listings change per request
+TERM_MAPPING_SYSTEM_PROMPT = """You are an expert insurance underwriter assistant. Your task is to suggest mappings between extracted contract fields and product combinations.
 
 Analyze the extracted fields and match them to the most relevant product combinations based on:
 1. Line of Business (LOB) and Class of Business (COB) alignment
@@ -547,13 +684,13 @@ Return a JSON array of suggested mappings. For each mapping include:
 
 Only suggest mappings where there's a clear logical connection. Don't force mappings for unrelated fields."""
 
-    user_prompt = f"""Please analyze these extracted contract fields and suggest mappings to product combinations.
+TERM_MAPPING_USER_PROMPT = """Please analyze these extracted contract fields and suggest mappings to product combinations.
 
 ## Extracted Fields:
-{fields_text}
+{fields}
 
 ## Available Product Combinations:
-{products_text}
+{products}
 
 Return a JSON array of mapping suggestions. Example format:
 [
@@ -563,41 +700,138 @@ Return a JSON array of mapping suggestions. Example format:
 
 Return ONLY the JSON array, no other text."""
 
-    try:
-        if request.model_provider == "anthropic":
-            import anthropic
-            from config.settings import ANTHROPIC_API_KEY
+# Several suggestion requests packed into one call share the system prompt
+TERM_MAPPING_PACKED_SYSTEM_PROMPT = TERM_MAPPING_SYSTEM_PROMPT + """
 
-            client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-            response_text = response.content[0].text
+You will be given several independent tasks, each with its own extracted fields and product combinations. Answer every task separately under its task_id, and only map a task's fields to that task's own product combinations."""
 
-        elif request.model_provider == "openai":
-            import openai
-            from config.settings import OPENAI_API_KEY
+TERM_MAPPING_TASK_PROMPT = """## Task {task_id}
 
-            client = openai.OpenAI(api_key=OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                max_tokens=4096,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt + "\n\nWrap your response in a JSON object with a 'suggestions' array."},
-                ],
-            )
-            response_text = response.choices[0].message.content
+### Extracted Fields:
+{fields}
+
+### Available Product Combinations:
+{products}"""
+
+
+# Fields beyond this many are left out of the prompt and reported as omitted
+SUGGESTION_FIELD_LIMIT = 200
+
+
+def _product_gwp(product: dict) -> float:
+    """A product combination's GWP as a number; missing or malformed values count as 0."""
+    try:
+        return float(product.get("total_gwp") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _term_mapping_inputs(request: SuggestMappingsRequest) -> tuple[list[dict], list[dict]]:
+    """The fields and product combinations offered to the model, in prompt order."""
+    # Fields beyond the limit are dropped in the order the client sent them; the
+    # kept ones are then listed by path, so a reordered payload reuses the cached answer
+    fields = sorted(
+        request.extracted_fields[:SUGGESTION_FIELD_LIMIT],
+        key=lambda f: (f["path"], str(f.get("value", ""))),
+    )
+    # Offer the 50 largest products by GWP, ties broken by ID so the order is canonical
+    products = sorted(request.product_combinations, key=lambda p: (-_product_gwp(p), str(p["id"])))[:50]
+    return fields, products
+
+
+def _term_mapping_listings(request: SuggestMappingsRequest) -> tuple[str, str]:
+    """Prompt listings of the offered fields and product combinations."""
+    fields, products = _term_mapping_inputs(request)
+
+    # Truncate long field values
+    field_lines = []
+    for f in fields:
+        value = f.get("value", "")
+        if not isinstance(value, str):
+            value = str(value)
+        if len(value) > 100:
+            value = f"{value[:100]}..."
+        field_lines.append(f"- {f['path']}: {value}")
+    fields_text = "\n".join(field_lines)
+
+    product_lines = []
+    for p in products:
+        names = " > ".join(
+            (p.get(level) or {}).get("name", "N/A")
+            for level in ("lob", "cob", "product", "sub_product", "mpp")
+        )
+        product_lines.append(f"- ID: {p['id']} | {names} (GWP: ${p.get('total_gwp', 0)})")
+    products_text = "\n".join(product_lines)
+
+    return fields_text, products_text
+
+
+def _term_mapping_prompts(request: SuggestMappingsRequest) -> tuple[str, str]:
+    """System and user prompts for suggesting term mappings."""
+    fields_text, products_text = _term_mapping_listings(request)
+    user_prompt = TERM_MAPPING_USER_PROMPT.format(fields=fields_text, products=products_text)
+
+    return TERM_MAPPING_SYSTEM_PROMPT, user_prompt
+
+
+# Anthropic is made to answer through this tool, so suggestions arrive as parsed JSON
+SUGGESTIONS_TOOL = {
+    "name": "emit_suggestions",
+    "description": "Return the suggestions as structured data.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "suggestions": {"type": "array", "items": {"type": "object"}},
+        },
+        "required": ["suggestions"],
+    },
+}
+
+
+# Packed suggestion requests are answered per task through this tool
+TASK_SUGGESTIONS_TOOL = {
+    "name": "emit_task_suggestions",
+    "description": "Return the suggestions for every task as structured data.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "tasks": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "task_id": {"type": "string"},
+                        "suggestions": {"type": "array", "items": {"type": "object"}},
+                    },
+                    "required": ["task_id", "suggestions"],
+                },
+            },
+        },
+        "required": ["tasks"],
+    },
+}
+
+
+def _openai_response_format(model: type[BaseModel]) -> dict:
+    """Structured output format holding OpenAI to the model's JSON schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "strict": True, "schema": model.model_json_schema()},
+    }
 
-        else:
-            # Default fallback for landingai or unsupported providers
-            return {"suggestions": [], "error": f"Provider {request.model_provider} not yet supported for mapping suggestions"}
 
-        # Parse JSON response
+# OpenAI answers are constrained to these schemas, so they always parse
+MAPPING_RESPONSE_FORMAT = _openai_response_format(MappingSuggestionList)
+PACKED_MAPPING_RESPONSE_FORMAT = _openai_response_format(TaskMappingSuggestionsList)
+PRODUCT_RESPONSE_FORMAT = _openai_response_format(SuggestedProductList)
+
+
+def _parse_suggestions(response_text: str) -> list:
+    """Parse the suggestions array from a model response, tolerating code fences."""
+    try:
+        parsed = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        # Models sometimes wrap the JSON in a markdown code fence
         response_text = response_text.strip()
         if response_text.startswith("```json"):
             response_text = response_text[7:]
@@ -605,24 +839,602 @@ Return ONLY the JSON array, no other text."""
             response_text = response_text[3:]
         if response_text.endswith("```"):
             response_text = response_text[:-3]
-        response_text = response_text.strip()
+        parsed = orjson.loads(response_text.strip())
+
+    # Handle both array and object with suggestions key
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, dict) and "suggestions" in parsed:
+        return parsed["suggestions"]
+    return []
+
+
+def _anthropic_suggestions(message) -> list:
+    """Suggestions from an Anthropic message: the tool input, else the text answer."""
+    for block in message.content:
+        if getattr(block, "type", None) == "tool_use":
+            return block.input.get("suggestions", [])
+    return _parse_suggestions(message.content[0].text)
+
+
+def _anthropic_suggestion_params(system_prompt: str, user_prompt: str, context: Optional[str] = None) -> dict:
+    """Anthropic Messages request body for a suggestion prompt.
+
+    ``context`` is reference material that repeats across calls; it is sent as a
+    second system block marked for prompt caching.
+    """
+    system = system_prompt
+    if context:
+        system = [
+            {"type": "text", "text": system_prompt},
+            {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+        ]
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 4096,
+        "system": system,
+        "messages": [{"role": "user", "content": user_prompt}],
+        "tools": [SUGGESTIONS_TOOL],
+        "tool_choice": {"type": "tool", "name": SUGGESTIONS_TOOL["name"]},
+    }
+
+
+def _openai_suggestion_params(
+    system_prompt: str,
+    user_prompt: str,
+    context: Optional[str] = None,
+    response_format: dict = MAPPING_RESPONSE_FORMAT,
+) -> dict:
+    """OpenAI chat completions request body for a suggestion prompt."""
+    if context:
+        # OpenAI caches long prompt prefixes automatically
+        system_prompt = f"{system_prompt}\n\n{context}"
+    return {
+        "model": "gpt-4o",
+        "max_tokens": 4096,
+        "response_format": response_format,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt + "\n\nWrap your response in a JSON object with a 'suggestions' array."},
+        ],
+    }
 
-        parsed = json.loads(response_text)
 
-        # Handle both array and object with suggestions key
-        if isinstance(parsed, list):
-            suggestions = parsed
-        elif isinstance(parsed, dict) and "suggestions" in parsed:
-            suggestions = parsed["suggestions"]
+# Parsed suggestions keyed by prompt, so retries and repeated reviews of the same
+# inputs skip the model call; changed extraction data changes the prompt and key
+SUGGESTION_CACHE_TTL = 3600.0
+SUGGESTION_CACHE_SIZE = 1024
+_suggestion_cache: TTLCache[list] = TTLCache(SUGGESTION_CACHE_TTL, SUGGESTION_CACHE_SIZE)
+
+
+def _suggestion_cache_key(
+    model_provider: str,
+    system_prompt: str,
+    user_prompt: str,
+    context: Optional[str] = None,
+) -> str:
+    """Cache key for a suggestion prompt sent to one provider."""
+    return hashlib.blake2b(
+        "\0".join((model_provider, system_prompt, context or "", user_prompt)).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+class SuggestionStreamParser:
+    """Pulls complete suggestion objects out of JSON text as it streams in.
+
+    Any object directly inside an array is a suggestion, which covers both a bare
+    array and the {"suggestions": [...]} wrapper the structured answers use.
+    """
+
+    def __init__(self):
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._item_depth: Optional[int] = None
+        self._item: list[str] = []
+
+    def feed(self, text: str) -> list:
+        """Consume the next chunk of text, returning the suggestions it completed."""
+        completed = []
+        for char in text:
+            if self._item_depth is not None:
+                self._item.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if char == "{" and self._item_depth is None and self._stack[-1:] == ["["]:
+                    self._item_depth = len(self._stack)
+                    self._item = [char]
+                self._stack.append(char)
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                if len(self._stack) == self._item_depth:
+                    completed.append(orjson.loads("".join(self._item)))
+                    self._item_depth = None
+        return completed
+
+
+async def _stream_suggestions(
+    model_provider: str,
+    system_prompt: str,
+    user_prompt: str,
+    context: Optional[str] = None,
+    response_format: dict = MAPPING_RESPONSE_FORMAT,
+):
+    """Yield suggestions one by one as the model generates them.
+
+    A cached answer is replayed at once, and a completed stream is cached like
+    a regular call.
+    """
+    key = _suggestion_cache_key(model_provider, system_prompt, user_prompt, context)
+    cached = _suggestion_cache.get(key)
+    if cached is not None:
+        for suggestion in cached:
+            yield suggestion
+        return
+
+    parser = SuggestionStreamParser()
+    suggestions = []
+    client = async_llm_client(model_provider)
+    async with llm_limiter(model_provider):
+        if model_provider == "anthropic":
+            async with client.messages.stream(
+                **_anthropic_suggestion_params(system_prompt, user_prompt, context)
+            ) as stream:
+                async for event in stream:
+                    if event.type == "input_json":
+                        chunk = event.partial_json
+                    elif event.type == "text":
+                        chunk = event.text
+                    else:
+                        continue
+                    for suggestion in parser.feed(chunk):
+                        suggestions.append(suggestion)
+                        yield suggestion
         else:
-            suggestions = []
+            stream = await client.chat.completions.create(
+                **_openai_suggestion_params(system_prompt, user_prompt, context, response_format),
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                for suggestion in parser.feed(chunk.choices[0].delta.content):
+                    suggestions.append(suggestion)
+                    yield suggestion
+
+    _suggestion_cache.set(key, suggestions)
+
+
+async def _suggest(
+    model_provider: str,
+    system_prompt: str,
+    user_prompt: str,
+    context: Optional[str] = None,
+    response_format: dict = MAPPING_RESPONSE_FORMAT,
+) -> list:
+    """Ask the model for suggestions, reusing a cached answer for an identical prompt."""
+    key = _suggestion_cache_key(model_provider, system_prompt, user_prompt, context)
+    cached = _suggestion_cache.get(key)
+    if cached is not None:
+        return cached
+
+    client = async_llm_client(model_provider)
+    if model_provider == "anthropic":
+        async with llm_limiter(model_provider):
+            response = await client.messages.create(
+                **_anthropic_suggestion_params(system_prompt, user_prompt, context)
+            )
+        suggestions = _anthropic_suggestions(response)
+    else:
+        async with llm_limiter(model_provider):
+            response = await client.chat.completions.create(
+                **_openai_suggestion_params(system_prompt, user_prompt, context, response_format)
+            )
+        suggestions = _parse_suggestions(response.choices[0].message.content)
+
+    # Only answers that parse are cached, so a malformed one can be retried
+    _suggestion_cache.set(key, suggestions)
+    return suggestions
+
+
+SUGGESTION_PROVIDERS = ("anthropic", "openai")
+
+
+def _requested_providers(model_provider: str | list[str]) -> list[str]:
+    """Requested providers in order, without repeats; Anthropic if none are given."""
+    providers = [model_provider] if isinstance(model_provider, str) else model_provider
+    return list(dict.fromkeys(providers)) or ["anthropic"]
 
-        return {"suggestions": suggestions}
 
+async def _suggest_with_providers(
+    providers: list[str],
+    system_prompt: str,
+    user_prompt: str,
+    context: Optional[str] = None,
+    response_format: dict = MAPPING_RESPONSE_FORMAT,
+) -> list:
+    """Suggestions from one provider, or merged from several queried concurrently.
+
+    Merged suggestions are matched on field path and GWP breakdown, keeping the
+    highest confidence and every distinct reason. A provider that fails is
+    skipped as long as another one answered.
+    """
+    if len(providers) == 1:
+        return await _suggest(providers[0], system_prompt, user_prompt, context, response_format)
+
+    results = await asyncio.gather(
+        *(_suggest(provider, system_prompt, user_prompt, context, response_format) for provider in providers),
+        return_exceptions=True,
+    )
+    answered = [result for result in results if not isinstance(result, BaseException)]
+    if not answered:
+        raise results[0]
+
+    merged = {}
+    for suggestions in answered:
+        for suggestion in suggestions:
+            if not isinstance(suggestion, dict):
+                continue
+            key = (suggestion.get("field_path"), suggestion.get("gwp_breakdown_id"))
+            current = merged.get(key)
+            if current is None:
+                merged[key] = dict(suggestion)  # copy; cached suggestion lists are shared
+                continue
+            if float(suggestion.get("confidence") or 0) > float(current.get("confidence") or 0):
+                current["confidence"] = suggestion["confidence"]
+            reason = suggestion.get("reason")
+            if reason and reason not in (current.get("reason") or ""):
+                current["reason"] = f"{current['reason']} / {reason}" if current.get("reason") else reason
+    return list(merged.values())
+
+
+def _suggestion_response(request: SuggestMappingsRequest, suggestions: list) -> dict:
+    """Suggestions for one request, noting any fields left out of the prompt."""
+    response = {"suggestions": suggestions}
+    omitted = len(request.extracted_fields) - SUGGESTION_FIELD_LIMIT
+    if omitted > 0:
+        response["fields_omitted"] = omitted
+    return response
+
+
+async def _answer_term_mapping_request(
+    request: SuggestMappingsRequest, system_prompt: str, user_prompt: str
+) -> dict:
+    """Mapping suggestions for one request; provider failures are raised."""
+    providers = _requested_providers(request.model_provider)
+
+    unsupported = [provider for provider in providers if provider not in SUGGESTION_PROVIDERS]
+    if unsupported:
+        # Default fallback for landingai or unsupported providers
+        return {"suggestions": [], "error": f"Provider {unsupported[0]} not yet supported for mapping suggestions"}
+
+    return _suggestion_response(request, await _suggest_with_providers(providers, system_prompt, user_prompt))
+
+
+async def _term_mapping_suggestions(request: SuggestMappingsRequest) -> dict:
+    """Mapping suggestions for one request, with any failure reported in the result."""
+    system_prompt, user_prompt = _term_mapping_prompts(request)
+
+    try:
+        return await _answer_term_mapping_request(request, system_prompt, user_prompt)
+    except Exception as e:
+        return {"suggestions": [], "error": str(e)}
+
+
+@router.post("/term-mappings/suggest")
+async def suggest_term_mappings(
+    request: SuggestMappingsRequest,
+):
+    """Use AI to suggest mappings between extraction fields and product combinations."""
+    return await _term_mapping_suggestions(request)
+
+
+# Most requests one /term-mappings/suggest/many call may carry
+SUGGESTION_BATCH_LIMIT = 25
+# Requests packed into one model call by /term-mappings/suggest/many
+SUGGESTION_PACK_SIZE = 8
+PACKED_SUGGESTION_MAX_TOKENS = 16384
+
+# Shown for a failed request in a batch; the details are logged, not returned
+SUGGESTION_ERROR = "Mapping suggestions failed for this request"
+INVALID_SUGGESTION_REQUEST = "Extracted fields need a path and product combinations an id"
+
+
+async def _suggest_packed(model_provider: str, tasks: dict[str, SuggestMappingsRequest]) -> dict[str, list]:
+    """Suggestions for several requests from one model call, keyed by task ID.
+
+    Each task only keeps suggestions between its own offered fields and
+    products, so an answer that mixes tasks up cannot map across them. Tasks
+    missing from the answer are left out for the caller to retry.
+    """
+    user_prompt = "\n\n".join(
+        TERM_MAPPING_TASK_PROMPT.format(task_id=task_id, fields=fields_text, products=products_text)
+        for task_id, (fields_text, products_text) in (
+            (task_id, _term_mapping_listings(request)) for task_id, request in tasks.items()
+        )
+    )
+
+    client = async_llm_client(model_provider)
+    if model_provider == "anthropic":
+        async with llm_limiter(model_provider):
+            response = await client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=PACKED_SUGGESTION_MAX_TOKENS,
+                system=TERM_MAPPING_PACKED_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_prompt}],
+                tools=[TASK_SUGGESTIONS_TOOL],
+                tool_choice={"type": "tool", "name": TASK_SUGGESTIONS_TOOL["name"]},
+            )
+        answer = next(block.input for block in response.content if getattr(block, "type", None) == "tool_use")
+    else:
+        async with llm_limiter(model_provider):
+            response = await client.chat.completions.create(
+                model="gpt-4o",
+                max_tokens=PACKED_SUGGESTION_MAX_TOKENS,
+                response_format=PACKED_MAPPING_RESPONSE_FORMAT,
+                messages=[
+                    {"role": "system", "content": TERM_MAPPING_PACKED_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+            )
+        answer = orjson.loads(response.choices[0].message.content)
+
+    answered = {}
+    for task in answer.get("tasks") or []:
+        task_id = str(task.get("task_id"))
+        if task_id not in tasks or not isinstance(task.get("suggestions"), list):
+            continue
+        fields, products = _term_mapping_inputs(tasks[task_id])
+        paths = {f["path"] for f in fields}
+        product_ids = {str(p["id"]) for p in products}
+        answered[task_id] = [
+            suggestion for suggestion in task["suggestions"]
+            if isinstance(suggestion, dict)
+            and suggestion.get("field_path") in paths
+            and str(suggestion.get("gwp_breakdown_id")) in product_ids
+        ]
+    return answered
+
+
+async def _batched_term_mapping_suggestions(request: SuggestMappingsRequest) -> dict:
+    """Mapping suggestions for one request of a batch, asked on its own."""
+    try:
+        system_prompt, user_prompt = _term_mapping_prompts(request)
+        return await _answer_term_mapping_request(request, system_prompt, user_prompt)
+    except Exception:
+        logger.exception("Mapping suggestions failed for extraction %s", request.extraction_id)
+        return {"suggestions": [], "error": SUGGESTION_ERROR}
+
+
+@router.post("/term-mappings/suggest/many")
+async def suggest_many_term_mappings(
+    requests: List[SuggestMappingsRequest] = Body(..., max_length=SUGGESTION_BATCH_LIMIT),
+):
+    """
+    Suggest mappings for several extractions, packing them into shared model calls.
+
+    Requests for one supported provider without a cached answer are sent
+    SUGGESTION_PACK_SIZE at a time in a single call and answered per task,
+    so the system prompt and the wait for a rate-limit slot are paid once per
+    pack. Each answer is cached as if it had been asked alone. If a pack's
+    answer cannot be parsed or leaves tasks out, those tasks are asked one by
+    one. Other requests are answered like /term-mappings/suggest.
+
+    Results come back in request order in the same shape as
+    /term-mappings/suggest. A request that fails gets its own error entry
+    without failing the others.
+    """
+    results: list[Optional[dict]] = [None] * len(requests)
+    cache_keys: dict[int, str] = {}
+    packs: dict[str, list[int]] = {}
+    singles = []
+    for index, request in enumerate(requests):
+        # Malformed fields or products are rejected before any model call
+        try:
+            system_prompt, user_prompt = _term_mapping_prompts(request)
+        except (KeyError, TypeError, AttributeError):
+            results[index] = {"suggestions": [], "error": INVALID_SUGGESTION_REQUEST}
+            continue
+
+        providers = _requested_providers(request.model_provider)
+        if len(providers) == 1 and providers[0] in SUGGESTION_PROVIDERS:
+            cache_keys[index] = _suggestion_cache_key(providers[0], system_prompt, user_prompt)
+            if _suggestion_cache.get(cache_keys[index]) is None:
+                packs.setdefault(providers[0], []).append(index)
+                continue
+        singles.append(index)
+
+    async def answer_alone(index: int):
+        results[index] = await _batched_term_mapping_suggestions(requests[index])
+
+    async def answer_pack(model_provider: str, indexes: list[int]):
+        if len(indexes) == 1:
+            return await answer_alone(indexes[0])
+        try:
+            answered = await _suggest_packed(model_provider, {str(index): requests[index] for index in indexes})
+        except Exception:
+            logger.warning("Packed mapping suggestions failed; asking each request alone", exc_info=True)
+            answered = {}
+
+        unanswered = []
+        for index in indexes:
+            suggestions = answered.get(str(index))
+            if suggestions is None:
+                unanswered.append(index)
+                continue
+            _suggestion_cache.set(cache_keys[index], suggestions)
+            results[index] = _suggestion_response(requests[index], suggestions)
+        await asyncio.gather(*(answer_alone(index) for index in unanswered))
+
+    await asyncio.gather(
+        *(answer_alone(index) for index in singles),
+        *(
+            answer_pack(model_provider, indexes[start:start + SUGGESTION_PACK_SIZE])
+            for model_provider, indexes in packs.items()
+            for start in range(0, len(indexes), SUGGESTION_PACK_SIZE)
+        ),
+    )
+    return {"results": results}
+
+
+@router.post("/term-mappings/suggest/stream")
+async def stream_term_mapping_suggestions(
+    request: SuggestMappingsRequest,
+):
+    """Stream mapping suggestions as newline-delimited JSON while the model generates them.
+
+    Each line is one suggestion; a failure mid-stream ends with an {"error": ...} line.
+    """
+    providers = _requested_providers(request.model_provider)
+    if len(providers) != 1 or providers[0] not in SUGGESTION_PROVIDERS:
+        raise HTTPException(status_code=400, detail="Streaming needs a single provider: anthropic or openai")
+
+    system_prompt, user_prompt = _term_mapping_prompts(request)
+
+    async def lines():
+        try:
+            async for suggestion in _stream_suggestions(providers[0], system_prompt, user_prompt):
+                yield orjson.dumps(suggestion) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+class BatchSuggestMappingsRequest(BaseModel):
+    model_provider: str = "anthropic"  # anthropic or openai
+    requests: List[SuggestMappingsRequest]
+
+
+def _suggestion_result(parse, response) -> dict:
+    """Suggestions parsed from one batched response, in the online endpoint's shape."""
+    try:
+        return {"suggestions": parse(response)}
     except Exception as e:
         return {"suggestions": [], "error": str(e)}
 
 
+@router.post("/term-mappings/suggest/batch")
+async def submit_term_mapping_batch(
+    request: BatchSuggestMappingsRequest,
+):
+    """
+    Queue mapping suggestions for many extractions on the provider's batch API.
+
+    Batches cost less than online calls but complete asynchronously (within
+    24 hours); poll the returned batch ID for results, keyed by extraction ID.
+    """
+    if request.model_provider not in ("anthropic", "openai"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Provider {request.model_provider} does not support batch suggestions"
+        )
+
+    if not request.requests:
+        raise HTTPException(status_code=400, detail="No suggestion requests provided")
+
+    # Extraction IDs are the batch custom IDs, so each may appear only once
+    prompts = {item.extraction_id: _term_mapping_prompts(item) for item in request.requests}
+    if len(prompts) != len(request.requests):
+        raise HTTPException(status_code=400, detail="Each extraction may only appear once per batch")
+
+    client = async_llm_client(request.model_provider)
+    try:
+        if request.model_provider == "anthropic":
+            batch = await client.messages.batches.create(requests=[
+                {"custom_id": extraction_id, "params": _anthropic_suggestion_params(*prompt)}
+                for extraction_id, prompt in prompts.items()
+            ])
+        else:
+            lines = b"\n".join(
+                orjson.dumps({
+                    "custom_id": extraction_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": _openai_suggestion_params(*prompt),
+                })
+                for extraction_id, prompt in prompts.items()
+            )
+            batch_file = await client.files.create(
+                file=("term_mapping_suggestions.jsonl", lines),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI batch submission failed: {str(e)}")
+
+    return {
+        "batch_id": batch.id,
+        "model_provider": request.model_provider,
+        "request_count": len(prompts),
+    }
+
+
+@router.get("/term-mappings/suggest/batch/{model_provider}/{batch_id}")
+async def get_term_mapping_batch(
+    model_provider: str,
+    batch_id: str,
+):
+    """Get the status of a suggestion batch, with results per extraction once it has finished."""
+    if model_provider not in ("anthropic", "openai"):
+        raise HTTPException(status_code=400, detail=f"Unsupported provider: {model_provider}")
+
+    client = async_llm_client(model_provider)
+    results = {}
+    try:
+        if model_provider == "anthropic":
+            batch = await client.messages.batches.retrieve(batch_id)
+            status = batch.processing_status
+            if status == "ended":
+                async for entry in await client.messages.batches.results(batch_id):
+                    if entry.result.type == "succeeded":
+                        results[entry.custom_id] = _suggestion_result(_anthropic_suggestions, entry.result.message)
+                    else:
+                        results[entry.custom_id] = {"suggestions": [], "error": f"Request {entry.result.type}"}
+        else:
+            batch = await client.batches.retrieve(batch_id)
+            status = batch.status
+            # Expired and cancelled batches still return whatever had completed
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id or status not in ("completed", "expired", "cancelled"):
+                    continue
+                content = await client.files.content(file_id)
+                for line in content.text.splitlines():
+                    entry = orjson.loads(line)
+                    response = entry.get("response") or {}
+                    if response.get("status_code") == 200:
+                        results[entry["custom_id"]] = _suggestion_result(
+                            _parse_suggestions, response["body"]["choices"][0]["message"]["content"]
+                        )
+                    else:
+                        results[entry["custom_id"]] = {
+                            "suggestions": [],
+                            "error": str(entry.get("error") or response.get("body")),
+                        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI batch retrieval failed: {str(e)}")
+
+    return {
+        "batch_id": batch_id,
+        "model_provider": model_provider,
+        "status": status,
+        "results": results,
+    }
+
+
 # =============================================================================
 # CONTRACT-PRODUCT LINKING ENDPOINTS (NEW)
 # =============================================================================
@@ -648,47 +1460,57 @@ def create_contract_product_links(
 ):
     """Link a contract (via extraction) to one or more product combinations."""
     # Verify extraction exists
-    extraction = db.query(Extraction).filter(Extraction.id == data.extraction_id).first()
-    if not extraction:
+    if not db.query(Extraction.id).filter(Extraction.id == data.extraction_id).first():
         raise HTTPException(status_code=404, detail="Extraction not found")
 
-    created_links = []
-    for gwp_id in data.gwp_breakdown_ids:
-        # Verify GWP breakdown exists
-        gwp = db.query(GWPBreakdown).filter(GWPBreakdown.id == gwp_id).first()
-        if not gwp:
-            continue  # Skip invalid IDs
-
-        # Check if link already exists
-        existing = db.query(ContractProductLink).filter(
-            ContractProductLink.extraction_id == data.extraction_id,
-            ContractProductLink.gwp_breakdown_id == gwp_id,
-        ).first()
-
-        if existing:
-            # Include existing link in response
-            created_links.append(ContractProductLinkResponse(
-                id=existing.id,
-                extraction_id=existing.extraction_id,
-                gwp_breakdown_id=existing.gwp_breakdown_id,
-                link_reason=existing.link_reason,
-                created_at=existing.created_at,
-                updated_at=existing.updated_at,
-                product_info=_build_product_info(gwp),
-                has_extraction=len(existing.product_extractions) > 0,
-                extraction_status=existing.product_extractions[0].status if existing.product_extractions else None,
-            ))
-            continue
+    # Each product is linked once, in request order
+    gwp_ids = list(dict.fromkeys(data.gwp_breakdown_ids))
 
-        # Create new link
-        link = ContractProductLink(
-            extraction_id=data.extraction_id,
-            gwp_breakdown_id=gwp_id,
-            link_reason=data.link_reason,
+    gwps = {
+        gwp.id: gwp
+        for gwp in db.query(GWPBreakdown).options(
+            *(selectinload(dimension) for dimension in GWP_DIMENSIONS)
+        ).filter(
+            GWPBreakdown.id.in_(gwp_ids)
+        ).all()
+    }
+    gwp_ids = [gwp_id for gwp_id in gwp_ids if gwp_id in gwps]  # Skip invalid IDs
+
+    # Insert every link in one statement; ones that already exist are skipped by
+    # the unique constraint rather than checked for first
+    dialect_insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    new_links = {
+        link.gwp_breakdown_id: link
+        for link in db.scalars(
+            dialect_insert(ContractProductLink).on_conflict_do_nothing(
+                index_elements=["extraction_id", "gwp_breakdown_id"]
+            ).returning(ContractProductLink),
+            [
+                {
+                    "extraction_id": data.extraction_id,
+                    "gwp_breakdown_id": gwp_id,
+                    "link_reason": data.link_reason,
+                }
+                for gwp_id in gwp_ids
+            ],
         )
-        db.add(link)
-        db.flush()  # Get the ID
+    } if gwp_ids else {}
+
+    existing_ids = [gwp_id for gwp_id in gwp_ids if gwp_id not in new_links]
+    existing_links = {
+        link.gwp_breakdown_id: link
+        for link in db.query(ContractProductLink).options(
+            selectinload(ContractProductLink.product_extractions)
+        ).filter(
+            ContractProductLink.extraction_id == data.extraction_id,
+            ContractProductLink.gwp_breakdown_id.in_(existing_ids),
+        ).all()
+    } if existing_ids else {}
 
+    created_links = []
+    for gwp_id in gwp_ids:
+        link = new_links.get(gwp_id) or existing_links[gwp_id]
+        has_extraction = gwp_id not in new_links and len(link.product_extractions) > 0
         created_links.append(ContractProductLinkResponse(
             id=link.id,
             extraction_id=link.extraction_id,
@@ -696,9 +1518,9 @@ def create_contract_product_links(
             link_reason=link.link_reason,
             created_at=link.created_at,
             updated_at=link.updated_at,
-            product_info=_build_product_info(gwp),
-            has_extraction=False,
-            extraction_status=None,
+            product_info=_build_product_info(gwps[gwp_id]),
+            has_extraction=has_extraction,
+            extraction_status=link.product_extractions[0].status if has_extraction else None,
         ))
 
     db.commit()
@@ -715,13 +1537,19 @@ def get_contract_product_links(
     db: Session = Depends(get_db),
 ):
     """Get all product combinations linked to a contract extraction."""
-    links = db.query(ContractProductLink).filter(
+    links = db.query(ContractProductLink).options(
+        *(
+            selectinload(ContractProductLink.gwp_breakdown).selectinload(dimension)
+            for dimension in GWP_DIMENSIONS
+        ),
+        selectinload(ContractProductLink.product_extractions),
+    ).filter(
         ContractProductLink.extraction_id == extraction_id
     ).all()
 
     response_links = []
     for link in links:
-        gwp = db.query(GWPBreakdown).filter(GWPBreakdown.id == link.gwp_breakdown_id).first()
+        gwp = link.gwp_breakdown
         if gwp:
             response_links.append(ContractProductLinkResponse(
                 id=link.id,
@@ -747,7 +1575,7 @@ def delete_contract_product_link(
     db: Session = Depends(get_db),
 ):
     """Remove a contract-product link."""
-    link = db.query(ContractProductLink).filter(ContractProductLink.id == link_id).first()
+    link = db.get(ContractProductLink, link_id)
     if not link:
         raise HTTPException(status_code=404, detail="Contract-product link not found")
 
@@ -757,38 +1585,125 @@ def delete_contract_product_link(
     return {"message": "Contract-product link removed successfully"}
 
 
-@router.post("/contract-links/suggest", response_model=SuggestProductsResponse)
-def suggest_products_for_contract(
-    request: SuggestProductsRequest,
-    db: Session = Depends(get_db),
-):
-    """Use AI to suggest which product combinations a contract should be linked to."""
-    # Get the extraction with its data
-    extraction = db.query(Extraction).filter(Extraction.id == request.extraction_id).first()
+# Product lines per member for suggestion prompts, with term vectors for ranking.
+# Entries are dropped when this process writes a GWP breakdown or product
+# dimension through the ORM. Other workers and raw SQL writes do not invalidate
+# them, so the short TTL bounds how stale a listing can get.
+MEMBER_PRODUCTS_CACHE_TTL = 60.0
+MEMBER_PRODUCTS_CACHE_SIZE = 128
+_member_products_cache: TTLCache[list] = TTLCache(MEMBER_PRODUCTS_CACHE_TTL, MEMBER_PRODUCTS_CACHE_SIZE)
+
+# Members with more products than this only get the most relevant ones in the prompt
+SUGGESTION_PRODUCT_LIMIT = 20
+
+_TERM_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _term_vector(text: str) -> tuple[Counter, float]:
+    """Lowercase word counts of a text and their Euclidean norm."""
+    terms = Counter(_TERM_PATTERN.findall(text.lower()))
+    return terms, math.sqrt(sum(count * count for count in terms.values()))
+
+
+def _member_products(db: Session, member_id: str) -> list[tuple[str, Counter, float]]:
+    """A member's product combinations as prompt lines with term vectors, cached per member."""
+    cached = _member_products_cache.get(member_id)
+    if cached is not None:
+        return cached
+
+    gwp_rows = db.query(GWPBreakdown).options(
+        *(selectinload(dimension) for dimension in GWP_DIMENSIONS)
+    ).filter(GWPBreakdown.member_id == member_id).order_by(GWPBreakdown.total_gwp.desc()).all()
+
+    products = []
+    for gwp in gwp_rows:
+        names = f"{gwp.line_of_business.name} > {gwp.class_of_business.name} > {gwp.product.name} > {gwp.sub_product.name} > {gwp.member_product_program.name}"
+        products.append((f"- ID: {gwp.id} | {names} (GWP: ${gwp.total_gwp})", *_term_vector(names)))
+
+    _member_products_cache.set(member_id, products)
+    return products
+
+
+def _products_prompt_text(products: list[tuple[str, Counter, float]], contract_text: str) -> str:
+    """Prompt listing of the products, narrowed to those closest to the contract text.
+
+    Small product sets are listed whole (largest GWP first), so the prompt stays
+    identical across contracts and cacheable. Larger ones are ranked by cosine
+    similarity of their dimension names to the contract text.
+    """
+    if len(products) > SUGGESTION_PRODUCT_LIMIT:
+        query_terms, query_norm = _term_vector(contract_text)
+
+        def similarity(product) -> float:
+            _, terms, norm = product
+            if not norm or not query_norm:
+                return 0.0
+            return sum(count * query_terms[term] for term, count in terms.items()) / (norm * query_norm)
+
+        # sorted() is stable, so equally similar products keep GWP order
+        products = sorted(products, key=similarity, reverse=True)[:SUGGESTION_PRODUCT_LIMIT]
+
+    return "\n".join(line for line, _, _ in products)
+
+
+def invalidate_member_products(*_):
+    """Drop all cached product listings; used as a mapper event listener."""
+    _member_products_cache.clear()
+
+
+for _model in (GWPBreakdown, LineOfBusiness, ClassOfBusiness, Product, SubProduct, MemberProductProgram):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, invalidate_member_products)
+
+
+def _load_suggestion_context(db: Session, extraction_id: str, member_key: str) -> tuple[str, str]:
+    """Prompt inputs for product suggestions: the extraction data and the member's products."""
+    # Get the start of the extraction's stored JSON, truncated in SQL (limit size)
+    extraction = db.query(
+        func.substr(cast(Extraction.extracted_data, Text), 1, 3000).label("data_excerpt")
+    ).filter(Extraction.id == extraction_id).first()
     if not extraction:
         raise HTTPException(status_code=404, detail="Extraction not found")
 
     # Get member's products
-    member = db.query(Member).filter(Member.id == request.member_id).first()
-    if not member:
-        member = db.query(Member).filter(Member.member_id == request.member_id).first()
+    member = _find_member(db, member_key)
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
 
-    # Get all GWP breakdowns for this member
-    gwp_rows = db.query(GWPBreakdown).filter(GWPBreakdown.member_id == member.id).all()
+    extracted_text = extraction.data_excerpt if extraction.data_excerpt not in (None, "null") else "{}"
 
-    # Format extracted data for AI
-    extracted_data = extraction.extracted_data or {}
-    extracted_text = json.dumps(extracted_data, indent=2, default=str)[:3000]  # Limit size
+    products_text = _products_prompt_text(_member_products(db, member.id), extracted_text)
+
+    return extracted_text, products_text
+
+
+def _build_product_suggestions(db: Session, raw_suggestions: list[dict]) -> list[ProductSuggestion]:
+    """Build ProductSuggestion objects with full product info for the AI's picks."""
+    gwps = {
+        gwp.id: gwp
+        for gwp in db.query(GWPBreakdown).options(
+            *(selectinload(dimension) for dimension in GWP_DIMENSIONS)
+        ).filter(
+            GWPBreakdown.id.in_({s.get("gwp_breakdown_id") for s in raw_suggestions})
+        ).all()
+    }
+
+    suggestions = []
+    for s in raw_suggestions:
+        gwp_id = s.get("gwp_breakdown_id")
+        gwp = gwps.get(gwp_id)
+        if gwp:
+            suggestions.append(ProductSuggestion(
+                gwp_breakdown_id=gwp_id,
+                product_info=_build_product_info(gwp),
+                confidence=float(s.get("confidence", 0.5)),
+                reason=s.get("reason", ""),
+            ))
+    return suggestions
 
-    # Format product combinations for AI
-    products_text = "\n".join([
-        f"- ID: {gwp.id} | {gwp.line_of_business.name} > {gwp.class_of_business.name} > {gwp.product.name} > {gwp.sub_product.name} > {gwp.member_product_program.name} (GWP: ${gwp.total_gwp})"
-        for gwp in gwp_rows[:50]  # Limit to 50 products
-    ])
 
-    system_prompt = """You are an expert insurance underwriter assistant. Your task is to determine which product combinations a contract applies to.
+# Prompt text is fixed; the member's products travel as cacheable context
+PRODUCT_SUGGESTION_SYSTEM_PROMPT = """You are an expert insurance underwriter assistant. Your task is to determine which product combinations a contract applies to.
 
 A contract may apply to one or more product combinations (LOB > COB > Product > Sub-Product > MPP).
 
@@ -806,15 +1721,12 @@ Return a JSON array of suggested products. For each suggestion include:
 
 Only suggest products where there's clear evidence the contract applies to them."""
 
-    user_prompt = f"""Analyze this contract and suggest which product combinations it should be linked to.
+PRODUCT_SUGGESTION_USER_PROMPT = """Analyze this contract and suggest which product combinations it should be linked to.
 
 ## Extracted Contract Data:
-{extracted_text}
+{extracted}
 
-## Available Product Combinations for this Member:
-{products_text}
-
-Return a JSON array of product suggestions. Example format:
+Choose from the product combinations listed in the system prompt. Return a JSON array of product suggestions. Example format:
 [
   {{"gwp_breakdown_id": "abc123", "confidence": 0.9, "reason": "Contract covers General Liability which matches this LOB"}},
   {{"gwp_breakdown_id": "def456", "confidence": 0.75, "reason": "Property coverage terms align with this product"}}
@@ -822,74 +1734,34 @@ Return a JSON array of product suggestions. Example format:
 
 Return ONLY the JSON array, no other text."""
 
-    try:
-        if request.model_provider == "anthropic":
-            import anthropic
-            from config.settings import ANTHROPIC_API_KEY
 
-            client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-            response_text = response.content[0].text
-
-        elif request.model_provider == "openai":
-            import openai
-            from config.settings import OPENAI_API_KEY
+@router.post("/contract-links/suggest", response_model=SuggestProductsResponse)
+async def suggest_products_for_contract(
+    request: SuggestProductsRequest,
+    db: Session = Depends(get_db),
+):
+    """Use AI to suggest which product combinations a contract should be linked to."""
+    # Database work runs in the threadpool; the LLM call is awaited on the event loop
+    extracted_text, products_text = await run_in_threadpool(
+        _load_suggestion_context, db, request.extraction_id, request.member_id
+    )
+    user_prompt = PRODUCT_SUGGESTION_USER_PROMPT.format(extracted=extracted_text)
 
-            client = openai.OpenAI(api_key=OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                max_tokens=4096,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt + "\n\nWrap your response in a JSON object with a 'suggestions' array."},
-                ],
-            )
-            response_text = response.choices[0].message.content
+    providers = _requested_providers(request.model_provider)
 
-        else:
+    try:
+        if any(provider not in SUGGESTION_PROVIDERS for provider in providers):
             return SuggestProductsResponse(
                 extraction_id=request.extraction_id,
                 suggestions=[],
             )
 
-        # Parse JSON response
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-
-        parsed = json.loads(response_text)
-
-        # Handle both array and object with suggestions key
-        if isinstance(parsed, list):
-            raw_suggestions = parsed
-        elif isinstance(parsed, dict) and "suggestions" in parsed:
-            raw_suggestions = parsed["suggestions"]
-        else:
-            raw_suggestions = []
-
-        # Build ProductSuggestion objects with full product info
-        suggestions = []
-        for s in raw_suggestions:
-            gwp_id = s.get("gwp_breakdown_id")
-            gwp = db.query(GWPBreakdown).filter(GWPBreakdown.id == gwp_id).first()
-            if gwp:
-                suggestions.append(ProductSuggestion(
-                    gwp_breakdown_id=gwp_id,
-                    product_info=_build_product_info(gwp),
-                    confidence=float(s.get("confidence", 0.5)),
-                    reason=s.get("reason", ""),
-                ))
+        # The member's product list repeats across calls, so it goes in the cacheable context
+        products_context = f"## Available Product Combinations for this Member:\n{products_text}"
+        raw_suggestions = await _suggest_with_providers(
+            providers, PRODUCT_SUGGESTION_SYSTEM_PROMPT, user_prompt, products_context, PRODUCT_RESPONSE_FORMAT
+        )
+        suggestions = await run_in_threadpool(_build_product_suggestions, db, raw_suggestions)
 
         return SuggestProductsResponse(
             extraction_id=request.extraction_id,
@@ -904,48 +1776,158 @@ Return ONLY the JSON array, no other text."""
 # PRODUCT EXTRACTION (AI ANALYSIS) ENDPOINTS
 # =============================================================================
 
-@router.post("/product-extractions/analyze", response_model=ProductExtractionResponse)
-def analyze_product_extraction(
-    request: ProductExtractionRequest,
-    db: Session = Depends(get_db),
-):
-    """Trigger AI analysis for a contract-product link to extract product-specific fields."""
+# Prompt text is fixed; only the field counts, contract data and product change per link
+PRODUCT_ANALYSIS_SYSTEM_PROMPT = """You are an expert insurance contract analyst. Your task is to enrich extracted contract data with citations and relevance scores for a specific product combination.
+
+CRITICAL REQUIREMENT: The input contains exactly {field_count} fields. Your response MUST contain exactly {field_count} fields in extracted_data. Do NOT omit ANY fields.
+
+The fields you MUST include are: {field_names}
+
+For EACH of the {field_count} fields:
+1. Copy the original value EXACTLY as provided
+2. Add a citation (exact text snippet from the contract) - use "No direct citation found" if none exists
+3. Add relevance_score (0-1) for this specific product combination
+4. Add brief reasoning
+
+Return a JSON object with:
+- extracted_data: Object with ALL {field_count} fields, each having {{value, citation, relevance_score, reasoning}}
+- analysis_summary: Brief explanation
+- confidence_score: Overall confidence (0-1)
+
+WARNING: Responses with fewer than {field_count} fields will be rejected. Include ALL fields regardless of relevance."""
+
+# The contract's data comes before the product so that every link of the same
+# extraction shares the prompt prefix, which the providers cache
+PRODUCT_ANALYSIS_DOCUMENT_PROMPT = """## Extracted Contract Data ({field_count} fields - YOU MUST INCLUDE ALL {field_count}):
+{extracted}
+
+## Original Contract Text (for citations):
+{contract_text}"""
+
+PRODUCT_ANALYSIS_TASK_PROMPT = """Product Combination:
+- Line of Business: {gwp.line_of_business.name} ({gwp.line_of_business.lob_id})
+- Class of Business: {gwp.class_of_business.name} ({gwp.class_of_business.cob_id})
+- Product: {gwp.product.name} ({gwp.product.product_id})
+- Sub-Product: {gwp.sub_product.name} ({gwp.sub_product.sub_product_id})
+- Member Product Program: {gwp.member_product_program.name} ({gwp.member_product_program.mpp_id})
+- Total GWP: ${gwp.total_gwp}
+
+TASK: Enrich ALL {field_count} fields with citations and relevance scores.
+
+Required output format:
+{{
+  "extracted_data": {{
+    "field_name": {{
+      "value": "COPY THE EXACT VALUE FROM INPUT",
+      "citation": "exact quote from contract or 'No direct citation found'",
+      "relevance_score": 0.0 to 1.0,
+      "reasoning": "brief explanation"
+    }}
+    // REPEAT FOR ALL {field_count} FIELDS
+  }},
+  "analysis_summary": "brief summary",
+  "confidence_score": 0.85
+}}
+
+MANDATORY: Your extracted_data object MUST have exactly {field_count} keys, the fields listed in the instructions.
+
+Return ONLY the JSON object."""
+
+
+def _analysis_contract(db: Session, contract_id: str):
+    """The contract's ID, filename and the excerpt of its original text used in the prompt."""
+    return db.query(
+        Contract.id,
+        Contract.filename,
+        func.substr(Contract.extracted_text, 1, 5000).label("text_excerpt"),
+    ).filter(Contract.id == contract_id).first()
+
+
+def _analysis_contract_prompts(extracted_data: dict, contract) -> tuple[str, str]:
+    """System and document prompts, shared by every product link of an extraction."""
+    # Compact JSON: indentation only adds input tokens
+    extracted_text = orjson.dumps(extracted_data, default=str).decode()
+
+    # Get contract text if available
+    contract_text = "Not available"
+    if contract and contract.text_excerpt:
+        contract_text = contract.text_excerpt
+
+    # Count fields for explicit instruction
+    field_count = len(extracted_data)
+
+    system_prompt = PRODUCT_ANALYSIS_SYSTEM_PROMPT.format(
+        field_count=field_count,
+        field_names=", ".join(extracted_data),
+    )
+    document_prompt = PRODUCT_ANALYSIS_DOCUMENT_PROMPT.format(
+        field_count=field_count,
+        extracted=extracted_text,
+        contract_text=contract_text,
+    )
+    return system_prompt, document_prompt
+
+
+def _analysis_authority_fields(link: ContractProductLink, gwp: GWPBreakdown, contract) -> dict:
+    """Authority columns describing the product and contract of an analyzed link."""
+    return {
+        "contract_link_id": link.id,
+        "member_id": gwp.member_id,
+        "gwp_breakdown_id": gwp.id,
+        "lob_name": gwp.line_of_business.name,
+        "cob_name": gwp.class_of_business.name,
+        "product_name": gwp.product.name,
+        "sub_product_name": gwp.sub_product.name,
+        "mpp_name": gwp.member_product_program.name,
+        "contract_id": contract.id if contract else None,
+        "contract_name": contract.filename if contract else "Unknown",
+    }
+
+
+def _prepare_product_analysis(db: Session, request: ProductExtractionRequest):
+    """Load a link's context and mark its analysis as processing.
+
+    Returns the stored response when the link is already analyzed, otherwise
+    the records and prompts the model call needs.
+    """
     # Get the contract-product link
-    link = db.query(ContractProductLink).filter(ContractProductLink.id == request.contract_link_id).first()
+    link = db.get(ContractProductLink, request.contract_link_id)
     if not link:
         raise HTTPException(status_code=404, detail="Contract-product link not found")
 
     # Get the extraction data
-    extraction = db.query(Extraction).filter(Extraction.id == link.extraction_id).first()
+    extraction = db.get(Extraction, link.extraction_id)
     if not extraction:
         raise HTTPException(status_code=404, detail="Extraction not found")
 
     # Get the product info
-    gwp = db.query(GWPBreakdown).filter(GWPBreakdown.id == link.gwp_breakdown_id).first()
+    gwp = db.get(
+        GWPBreakdown,
+        link.gwp_breakdown_id,
+        options=[joinedload(dimension) for dimension in GWP_DIMENSIONS],
+    )
     if not gwp:
         raise HTTPException(status_code=404, detail="Product combination not found")
 
-    # Get the contract for original text
-    contract = db.query(Contract).filter(Contract.id == extraction.contract_id).first()
+    # Get the contract and the excerpt of its original text used in the prompt
+    contract = _analysis_contract(db, extraction.contract_id)
 
     # Check if analysis already exists
     existing = db.query(ProductExtraction).filter(
         ProductExtraction.contract_link_id == link.id
     ).first()
 
-    # Handle force re-analysis: delete existing extraction and authority
+    # Handle force re-analysis: reset the existing extraction in place. Its
+    # authority keeps its ID (and portfolio entries); it is refreshed on completion
+    # and its data cleared if the forced run fails
     if request.force and existing:
-        # Delete existing authority first (foreign key constraint)
-        existing_authority = db.query(Authority).filter(
-            Authority.product_extraction_id == existing.id
-        ).first()
-        if existing_authority:
-            db.delete(existing_authority)
-
-        # Delete existing extraction
-        db.delete(existing)
-        db.commit()
-        existing = None  # Reset so we create fresh
+        existing.extracted_data = {}
+        existing.analysis_summary = None
+        existing.confidence_score = None
+        existing.error_message = None
+        existing.model_name = None
+        existing.completed_at = None
+        existing.status = "pending"
 
     if existing and existing.status == "completed":
         # Auto-create Authority if missing (for extractions completed before this feature)
@@ -974,19 +1956,7 @@ def analyze_product_extraction(
             db.commit()
 
         # Return existing completed analysis
-        return ProductExtractionResponse(
-            id=existing.id,
-            contract_link_id=existing.contract_link_id,
-            model_provider=existing.model_provider,
-            model_name=existing.model_name,
-            extracted_data=existing.extracted_data or {},
-            analysis_summary=existing.analysis_summary,
-            confidence_score=existing.confidence_score,
-            status=existing.status,
-            error_message=existing.error_message,
-            created_at=existing.created_at,
-            completed_at=existing.completed_at,
-        )
+        return ProductExtractionResponse.model_validate(existing)
 
     # Create or update extraction record
     if existing:
@@ -1000,191 +1970,224 @@ def analyze_product_extraction(
             status="processing",
         )
         db.add(product_extraction)
-    db.flush()
 
-    # Build product context
-    product_context = f"""Product Combination:
-- Line of Business: {gwp.line_of_business.name} ({gwp.line_of_business.lob_id})
-- Class of Business: {gwp.class_of_business.name} ({gwp.class_of_business.cob_id})
-- Product: {gwp.product.name} ({gwp.product.product_id})
-- Sub-Product: {gwp.sub_product.name} ({gwp.sub_product.sub_product_id})
-- Member Product Program: {gwp.member_product_program.name} ({gwp.member_product_program.mpp_id})
-- Total GWP: ${gwp.total_gwp}"""
-
-    # Format extracted data
     extracted_data = extraction.extracted_data or {}
-    extracted_text = json.dumps(extracted_data, indent=2, default=str)
+    system_prompt, document_prompt = _analysis_contract_prompts(extracted_data, contract)
+    task_prompt = PRODUCT_ANALYSIS_TASK_PROMPT.format(field_count=len(extracted_data), gwp=gwp)
 
-    # Get contract text if available
-    contract_text = ""
-    if contract and contract.extracted_text:
-        contract_text = contract.extracted_text[:5000]  # Limit size
+    # Authority details are read now, as committing expires the loaded product rows
+    authority_fields = _analysis_authority_fields(link, gwp, contract)
 
-    # Count fields for explicit instruction
-    field_count = len(extracted_data)
-    field_names = list(extracted_data.keys())
+    # Committed before the model call so no transaction stays open while it runs
+    db.commit()
 
-    system_prompt = f"""You are an expert insurance contract analyst. Your task is to enrich extracted contract data with citations and relevance scores for a specific product combination.
+    return product_extraction, authority_fields, system_prompt, document_prompt, task_prompt
+
+
+def _complete_product_analysis(
+    db: Session,
+    product_extraction: ProductExtraction,
+    authority_fields: dict,
+    model_name: str,
+    response_text: str,
+) -> ProductExtractionResponse:
+    """Store the model's analysis and create the matching Authority record."""
+    product_extraction.model_name = model_name
+
+    # Parse JSON response
+    response_text = response_text.strip()
+    if response_text.startswith("```json"):
+        response_text = response_text[7:]
+    elif response_text.startswith("```"):
+        response_text = response_text[3:]
+    if response_text.endswith("```"):
+        response_text = response_text[:-3]
+    response_text = response_text.strip()
+
+    parsed = orjson.loads(response_text)
+
+    # Update extraction record
+    product_extraction.extracted_data = parsed.get("extracted_data", {})
+    product_extraction.analysis_summary = parsed.get("analysis_summary", "")
+    product_extraction.confidence_score = float(parsed.get("confidence_score", 0.5))
+    product_extraction.status = "completed"
+    product_extraction.completed_at = datetime.utcnow()
+
+    # Create or refresh the Authority record, committed together with the analysis
+    authority_values = {
+        **authority_fields,
+        "extracted_data": product_extraction.extracted_data or {},
+        "analysis_summary": product_extraction.analysis_summary,
+    }
+    refreshed = db.query(Authority).filter(
+        Authority.product_extraction_id == product_extraction.id
+    ).update(authority_values, synchronize_session=False)
 
-CRITICAL REQUIREMENT: The input contains exactly {field_count} fields. Your response MUST contain exactly {field_count} fields in extracted_data. Do NOT omit ANY fields.
+    if not refreshed:
+        db.add(Authority(product_extraction_id=product_extraction.id, **authority_values))
 
-The fields you MUST include are: {', '.join(field_names)}
+    db.commit()
+    db.refresh(product_extraction)
 
-For EACH of the {field_count} fields:
-1. Copy the original value EXACTLY as provided
-2. Add a citation (exact text snippet from the contract) - use "No direct citation found" if none exists
-3. Add relevance_score (0-1) for this specific product combination
-4. Add brief reasoning
+    return ProductExtractionResponse.model_validate(product_extraction)
 
-Return a JSON object with:
-- extracted_data: Object with ALL {field_count} fields, each having {{value, citation, relevance_score, reasoning}}
-- analysis_summary: Brief explanation
-- confidence_score: Overall confidence (0-1)
 
-WARNING: Responses with fewer than {field_count} fields will be rejected. Include ALL fields regardless of relevance."""
+def _fail_product_analysis(
+    db: Session, product_extraction: ProductExtraction, error_message: str, forced: bool = False
+):
+    """Mark an analysis as failed.
+
+    A forced re-analysis has already discarded the previous result, so the
+    data its authority still holds is cleared rather than left looking current.
+    """
+    product_extraction.status = "failed"
+    product_extraction.error_message = error_message
+    if forced:
+        db.query(Authority).filter(
+            Authority.product_extraction_id == product_extraction.id
+        ).update({"extracted_data": {}, "analysis_summary": None}, synchronize_session=False)
+    db.commit()
 
-    user_prompt = f"""{product_context}
 
-## Extracted Contract Data ({field_count} fields - YOU MUST INCLUDE ALL {field_count}):
-{extracted_text}
+ANALYSIS_MODELS = {"anthropic": "claude-sonnet-4-20250514", "openai": "gpt-4o"}
 
-## Original Contract Text (for citations):
-{contract_text if contract_text else "Not available"}
+# Raw model answers keyed by prompt, so re-analyzing an unchanged link (e.g. after
+# its analysis was deleted) skips the model call; forced re-analysis bypasses it
+ANALYSIS_CACHE_TTL = 7 * 24 * 3600.0
+ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: TTLCache[str] = TTLCache(ANALYSIS_CACHE_TTL, ANALYSIS_CACHE_SIZE)
 
-TASK: Enrich ALL {field_count} fields with citations and relevance scores.
 
-Required output format:
-{{
-  "extracted_data": {{
-    "field_name": {{
-      "value": "COPY THE EXACT VALUE FROM INPUT",
-      "citation": "exact quote from contract or 'No direct citation found'",
-      "relevance_score": 0.0 to 1.0,
-      "reasoning": "brief explanation"
-    }}
-    // REPEAT FOR ALL {field_count} FIELDS
-  }},
-  "analysis_summary": "brief summary",
-  "confidence_score": 0.85
-}}
+def _anthropic_analysis_params(model_name: str, system_prompt: str, document_prompt: str, task_prompt: str) -> dict:
+    """Anthropic Messages request body for a product analysis."""
+    return {
+        "model": model_name,
+        "max_tokens": 16384,  # Increased for large field sets
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": [
+            # Cache breakpoint after the contract, reused by its other product links
+            {"type": "text", "text": document_prompt, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": task_prompt},
+        ]}],
+    }
 
-MANDATORY: Your extracted_data object MUST have exactly {field_count} keys: {', '.join(field_names[:10])}{'...' if len(field_names) > 10 else ''}
 
-Return ONLY the JSON object."""
+def _openai_analysis_params(model_name: str, system_prompt: str, document_prompt: str, task_prompt: str) -> dict:
+    """OpenAI chat completions request body for a product analysis."""
+    return {
+        "model": model_name,
+        "max_tokens": 16384,  # Increased for large field sets
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"{document_prompt}\n\n{task_prompt}"},
+        ],
+    }
 
-    try:
-        from datetime import datetime
 
-        if request.model_provider == "anthropic":
-            import anthropic
-            from config.settings import ANTHROPIC_API_KEY
+async def _request_analysis(
+    model_provider: str,
+    model_name: str,
+    system_prompt: str,
+    document_prompt: str,
+    task_prompt: str,
+) -> str:
+    """Ask the model for a product analysis, returning its raw answer.
+
+    Long answers are streamed so the connection stays active while the model
+    generates; the text is joined once the stream ends.
+    """
+    client = async_llm_client(model_provider)
+    prompt = (model_name, system_prompt, document_prompt, task_prompt)
+    if model_provider == "anthropic":
+        async with llm_limiter(model_provider):
+            async with client.messages.stream(**_anthropic_analysis_params(*prompt)) as stream:
+                return "".join([text async for text in stream.text_stream])
+
+    async with llm_limiter(model_provider):
+        stream = await client.chat.completions.create(**_openai_analysis_params(*prompt), stream=True)
+        return "".join([
+            chunk.choices[0].delta.content
+            async for chunk in stream
+            if chunk.choices and chunk.choices[0].delta.content
+        ])
+
+
+async def _analyze_link(db: Session, request: ProductExtractionRequest) -> ProductExtractionResponse:
+    """Run the AI analysis for one contract-product link, recording failures on its row."""
+    # Database work runs in the threadpool; the LLM call is awaited on the event loop
+    prepared = await run_in_threadpool(_prepare_product_analysis, db, request)
+    if isinstance(prepared, ProductExtractionResponse):
+        return prepared
+    product_extraction, authority_fields, system_prompt, document_prompt, task_prompt = prepared
 
-            client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=16384,  # Increased for large field sets
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
+    try:
+        model_name = ANALYSIS_MODELS.get(request.model_provider)
+        if model_name is None:
+            await run_in_threadpool(
+                _fail_product_analysis,
+                db, product_extraction, f"Unsupported provider: {request.model_provider}", request.force,
             )
-            response_text = response.content[0].text
-            product_extraction.model_name = "claude-sonnet-4-20250514"
-
-        elif request.model_provider == "openai":
-            import openai
-            from config.settings import OPENAI_API_KEY
+            raise HTTPException(status_code=400, detail=f"Unsupported provider: {request.model_provider}")
 
-            client = openai.OpenAI(api_key=OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                max_tokens=16384,  # Increased for large field sets
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+        key = hashlib.blake2b(
+            "\0".join((request.model_provider, model_name, system_prompt, document_prompt, task_prompt)).encode(),
+            digest_size=16,
+        ).hexdigest()
+        response_text = None if request.force else _analysis_cache.get(key)
+        if response_text is None:
+            response_text = await _request_analysis(
+                request.model_provider, model_name, system_prompt, document_prompt, task_prompt
             )
-            response_text = response.choices[0].message.content
-            product_extraction.model_name = "gpt-4o"
 
-        else:
-            product_extraction.status = "failed"
-            product_extraction.error_message = f"Unsupported provider: {request.model_provider}"
-            db.commit()
-            raise HTTPException(status_code=400, detail=f"Unsupported provider: {request.model_provider}")
+        result = await run_in_threadpool(
+            _complete_product_analysis, db, product_extraction, authority_fields, model_name, response_text
+        )
+        # Only answers that parsed and were stored are cached
+        _analysis_cache.set(key, response_text)
+        return result
 
-        # Parse JSON response
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
+    except orjson.JSONDecodeError as e:
+        await run_in_threadpool(
+            _fail_product_analysis, db, product_extraction, f"Failed to parse AI response: {str(e)}", request.force
+        )
+        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
+    except Exception as e:
+        await run_in_threadpool(_fail_product_analysis, db, product_extraction, str(e), request.force)
+        raise HTTPException(status_code=500, detail=f"AI analysis failed: {str(e)}")
 
-        parsed = json.loads(response_text)
 
-        # Update extraction record
-        product_extraction.extracted_data = parsed.get("extracted_data", {})
-        product_extraction.analysis_summary = parsed.get("analysis_summary", "")
-        product_extraction.confidence_score = float(parsed.get("confidence_score", 0.5))
-        product_extraction.status = "completed"
-        product_extraction.completed_at = datetime.utcnow()
+@router.post("/product-extractions/analyze", response_model=ProductExtractionResponse)
+async def analyze_product_extraction(
+    request: ProductExtractionRequest,
+    db: Session = Depends(get_db),
+):
+    """Trigger AI analysis for a contract-product link to extract product-specific fields."""
+    return await _analyze_link(db, request)
 
-        db.commit()
-        db.refresh(product_extraction)
 
-        # Auto-create Authority record
-        existing_authority = db.query(Authority).filter(
-            Authority.product_extraction_id == product_extraction.id
-        ).first()
+async def run_batch_analysis(link_ids: list[str], model_provider: str):
+    """Background task analyzing a batch of links concurrently.
 
-        if not existing_authority:
-            # Get member info from GWP breakdown
-            member = gwp.member
+    Each analysis gets its own session; failures are already recorded on the
+    extraction rows, so they don't stop the rest of the batch.
+    """
+    from backend.core.database import SessionLocal
 
-            authority = Authority(
-                product_extraction_id=product_extraction.id,
-                contract_link_id=link.id,
-                member_id=member.id,
-                gwp_breakdown_id=gwp.id,
-                lob_name=gwp.line_of_business.name,
-                cob_name=gwp.class_of_business.name,
-                product_name=gwp.product.name,
-                sub_product_name=gwp.sub_product.name,
-                mpp_name=gwp.member_product_program.name,
-                contract_id=contract.id if contract else None,
-                contract_name=contract.filename if contract else "Unknown",
-                extracted_data=product_extraction.extracted_data or {},
-                analysis_summary=product_extraction.analysis_summary,
-            )
-            db.add(authority)
-            db.commit()
+    semaphore = asyncio.Semaphore(PRODUCT_ANALYSIS_CONCURRENCY)
 
-        return ProductExtractionResponse(
-            id=product_extraction.id,
-            contract_link_id=product_extraction.contract_link_id,
-            model_provider=product_extraction.model_provider,
-            model_name=product_extraction.model_name,
-            extracted_data=product_extraction.extracted_data or {},
-            analysis_summary=product_extraction.analysis_summary,
-            confidence_score=product_extraction.confidence_score,
-            status=product_extraction.status,
-            error_message=product_extraction.error_message,
-            created_at=product_extraction.created_at,
-            completed_at=product_extraction.completed_at,
-        )
+    async def analyze(link_id: str):
+        async with semaphore:
+            db = SessionLocal()
+            try:
+                await _analyze_link(db, ProductExtractionRequest(
+                    contract_link_id=link_id,
+                    model_provider=model_provider,
+                ))
+            finally:
+                await run_in_threadpool(db.close)
 
-    except json.JSONDecodeError as e:
-        product_extraction.status = "failed"
-        product_extraction.error_message = f"Failed to parse AI response: {str(e)}"
-        db.commit()
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
-    except Exception as e:
-        product_extraction.status = "failed"
-        product_extraction.error_message = str(e)
-        db.commit()
-        raise HTTPException(status_code=500, detail=f"AI analysis failed: {str(e)}")
+    await asyncio.gather(*(analyze(link_id) for link_id in link_ids), return_exceptions=True)
 
 
 @router.get("/product-extractions/{link_id}", response_model=ProductExtractionResponse)
@@ -1200,58 +2203,323 @@ def get_product_extraction(
     if not extraction:
         raise HTTPException(status_code=404, detail="Product extraction not found")
 
-    return ProductExtractionResponse(
-        id=extraction.id,
-        contract_link_id=extraction.contract_link_id,
-        model_provider=extraction.model_provider,
-        model_name=extraction.model_name,
-        extracted_data=extraction.extracted_data or {},
-        analysis_summary=extraction.analysis_summary,
-        confidence_score=extraction.confidence_score,
-        status=extraction.status,
-        error_message=extraction.error_message,
-        created_at=extraction.created_at,
-        completed_at=extraction.completed_at,
-    )
+    return ProductExtractionResponse.model_validate(extraction)
 
 
 @router.post("/product-extractions/batch-analyze", response_model=BatchAnalyzeResponse)
 def batch_analyze_products(
     request: BatchAnalyzeRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
-    """Trigger AI analysis for all products linked to a contract."""
+    """
+    Trigger AI analysis for all products linked to a contract.
+
+    Links without a completed analysis are marked pending and analyzed
+    concurrently in the background; poll each link's extraction for results.
+    """
     # Get all links for this extraction
+    link_ids = [
+        row.id for row in db.query(ContractProductLink.id).filter(
+            ContractProductLink.extraction_id == request.extraction_id
+        ).all()
+    ]
+
+    if not link_ids:
+        raise HTTPException(status_code=404, detail="No product links found for this extraction")
+
+    # Existing analyses of these links, in one query
+    statuses = {}
+    for link_id, status in db.query(ProductExtraction.contract_link_id, ProductExtraction.status).filter(
+        ProductExtraction.contract_link_id.in_(link_ids)
+    ).all():
+        if statuses.get(link_id) != "completed":
+            statuses[link_id] = status
+
+    # Queue analysis for each link not yet analyzed, reusing an earlier unfinished row
+    pending_ids = [link_id for link_id in link_ids if statuses.get(link_id) != "completed"]
+    new_rows = [
+        {
+            "contract_link_id": link_id,
+            "model_provider": request.model_provider,
+            "status": "pending",
+        }
+        for link_id in pending_ids
+        if link_id not in statuses
+    ]
+
+    # Insert all new pending rows in a single executemany
+    if new_rows:
+        db.execute(insert(ProductExtraction), new_rows)
+    db.commit()
+    analyzed_count = len(pending_ids)
+
+    if pending_ids:
+        background_tasks.add_task(run_batch_analysis, pending_ids, request.model_provider)
+
+    return BatchAnalyzeResponse(
+        extraction_id=request.extraction_id,
+        links_analyzed=analyzed_count,
+        status="queued" if analyzed_count > 0 else "completed",
+    )
+
+
+# Provider batches complete within this window; a link still "processing" after
+# it (e.g. its batch ID was lost) is queued again by the next batch submission
+ANALYSIS_BATCH_WINDOW = timedelta(hours=24)
+
+
+def _prepare_analysis_batch(db: Session, request: BatchAnalyzeRequest) -> dict[str, tuple[str, str, str]]:
+    """Prompts for every link of an extraction that needs analysis, keyed by link ID.
+
+    Links with a completed analysis, or one a batch submitted within
+    ANALYSIS_BATCH_WINDOW is still processing, are skipped. The rest are
+    marked processing with one commit. A re-queued row's created_at is reset
+    to the submission time, which is what the staleness check reads.
+    """
     links = db.query(ContractProductLink).filter(
         ContractProductLink.extraction_id == request.extraction_id
+    ).options(
+        *(joinedload(ContractProductLink.gwp_breakdown).joinedload(dimension) for dimension in GWP_DIMENSIONS)
     ).all()
 
     if not links:
         raise HTTPException(status_code=404, detail="No product links found for this extraction")
 
-    # Queue analysis for each link
-    analyzed_count = 0
-    for link in links:
-        # Check if already analyzed
-        existing = db.query(ProductExtraction).filter(
-            ProductExtraction.contract_link_id == link.id,
-            ProductExtraction.status == "completed"
-        ).first()
+    extraction = db.get(Extraction, request.extraction_id)
+    if not extraction:
+        raise HTTPException(status_code=404, detail="Extraction not found")
 
-        if not existing:
-            # Create pending extraction
-            product_extraction = ProductExtraction(
-                contract_link_id=link.id,
-                model_provider=request.model_provider,
-                status="pending",
-            )
-            db.add(product_extraction)
-            analyzed_count += 1
+    # Links with an analysis that is done or still in flight, in one query
+    now = datetime.utcnow()
+    busy = {
+        link_id
+        for link_id, status, created_at in db.query(
+            ProductExtraction.contract_link_id, ProductExtraction.status, ProductExtraction.created_at
+        ).filter(ProductExtraction.contract_link_id.in_([link.id for link in links]))
+        if status == "completed"
+        or (status == "processing" and created_at and now - created_at < ANALYSIS_BATCH_WINDOW)
+    }
+    queued = [link for link in links if link.id not in busy]
+    if not queued:
+        return {}
 
+    # The extraction data and contract excerpt are the same for every link
+    extracted_data = extraction.extracted_data or {}
+    system_prompt, document_prompt = _analysis_contract_prompts(
+        extracted_data, _analysis_contract(db, extraction.contract_id)
+    )
+    prompts = {
+        link.id: (
+            system_prompt,
+            document_prompt,
+            PRODUCT_ANALYSIS_TASK_PROMPT.format(field_count=len(extracted_data), gwp=link.gwp_breakdown),
+        )
+        for link in queued
+    }
+
+    # Reuse each link's unfinished rows and add rows for links without one
+    queued_ids = list(prompts)
+    reused = {
+        link_id for (link_id,) in db.query(ProductExtraction.contract_link_id).filter(
+            ProductExtraction.contract_link_id.in_(queued_ids)
+        )
+    }
+    db.query(ProductExtraction).filter(
+        ProductExtraction.contract_link_id.in_(queued_ids),
+        ProductExtraction.status != "completed",
+    ).update({
+        "status": "processing",
+        "model_provider": request.model_provider,
+        "error_message": None,
+        "created_at": now,
+    }, synchronize_session=False)
+    new_rows = [
+        {
+            "contract_link_id": link_id,
+            "model_provider": request.model_provider,
+            "status": "processing",
+            "created_at": now,
+        }
+        for link_id in queued_ids
+        if link_id not in reused
+    ]
+    if new_rows:
+        db.execute(insert(ProductExtraction), new_rows)
     db.commit()
 
-    return BatchAnalyzeResponse(
-        extraction_id=request.extraction_id,
-        links_analyzed=analyzed_count,
-        status="queued" if analyzed_count > 0 else "completed",
-    )
+    return prompts
+
+
+def _store_analysis_batch(db: Session, model_name: str, answers: dict[str, tuple[Optional[str], Optional[str]]]) -> dict:
+    """Store batched analysis answers, given as ``{link_id: (response_text, error)}``.
+
+    Only links still being processed are updated, so polling a finished
+    batch again leaves earlier results alone.
+    """
+    extractions = db.query(ProductExtraction).filter(
+        ProductExtraction.contract_link_id.in_(answers),
+        ProductExtraction.status == "processing",
+    ).all()
+    if not extractions:
+        return {}
+
+    links = {
+        link.id: link
+        for link in db.query(ContractProductLink).filter(
+            ContractProductLink.id.in_([e.contract_link_id for e in extractions])
+        ).options(
+            *(joinedload(ContractProductLink.gwp_breakdown).joinedload(dimension) for dimension in GWP_DIMENSIONS)
+        ).all()
+    }
+    contracts = {
+        row.extraction_id: row
+        for row in db.query(Extraction.id.label("extraction_id"), Contract.id, Contract.filename).join(
+            Contract, Contract.id == Extraction.contract_id
+        ).filter(
+            Extraction.id.in_({link.extraction_id for link in links.values()})
+        ).all()
+    }
+
+    # Authority details are read up front, as each commit expires the loaded rows
+    pending = []
+    for product_extraction in extractions:
+        link = links.get(product_extraction.contract_link_id)
+        if link:
+            authority_fields = _analysis_authority_fields(link, link.gwp_breakdown, contracts.get(link.extraction_id))
+            pending.append((product_extraction, authority_fields, *answers[link.id]))
+
+    results = {}
+    for product_extraction, authority_fields, response_text, error in pending:
+        link_id = authority_fields["contract_link_id"]
+        if error is not None:
+            _fail_product_analysis(db, product_extraction, error)
+            results[link_id] = {"status": "failed", "error": error}
+            continue
+        try:
+            _complete_product_analysis(db, product_extraction, authority_fields, model_name, response_text)
+            results[link_id] = {"status": "completed"}
+        except Exception as e:
+            error = f"Failed to parse AI response: {str(e)}"
+            _fail_product_analysis(db, product_extraction, error)
+            results[link_id] = {"status": "failed", "error": error}
+
+    return results
+
+
+@router.post("/product-extractions/analyze/batch")
+async def submit_product_analysis_batch(
+    request: BatchAnalyzeRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Queue analysis of all products linked to a contract on the provider's batch API.
+
+    Batches cost less than online calls but complete asynchronously (within
+    24 hours); poll the returned batch ID to store the results.
+    """
+    model_name = ANALYSIS_MODELS.get(request.model_provider)
+    if model_name is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Provider {request.model_provider} does not support batch analysis"
+        )
+
+    # Link IDs are the batch custom IDs
+    prompts = await run_in_threadpool(_prepare_analysis_batch, db, request)
+    if not prompts:
+        return {
+            "batch_id": None,
+            "model_provider": request.model_provider,
+            "request_count": 0,
+        }
+
+    client = async_llm_client(request.model_provider)
+    try:
+        if request.model_provider == "anthropic":
+            batch = await client.messages.batches.create(requests=[
+                {"custom_id": link_id, "params": _anthropic_analysis_params(model_name, *prompt)}
+                for link_id, prompt in prompts.items()
+            ])
+        else:
+            lines = b"\n".join(
+                orjson.dumps({
+                    "custom_id": link_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": _openai_analysis_params(model_name, *prompt),
+                })
+                for link_id, prompt in prompts.items()
+            )
+            batch_file = await client.files.create(
+                file=("product_analyses.jsonl", lines),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+    except Exception as e:
+        error = f"AI batch submission failed: {str(e)}"
+        await run_in_threadpool(
+            _store_analysis_batch, db, model_name, {link_id: (None, error) for link_id in prompts}
+        )
+        raise HTTPException(status_code=500, detail=error)
+
+    return {
+        "batch_id": batch.id,
+        "model_provider": request.model_provider,
+        "request_count": len(prompts),
+    }
+
+
+@router.get("/product-extractions/analyze/batch/{model_provider}/{batch_id}")
+async def get_product_analysis_batch(
+    model_provider: str,
+    batch_id: str,
+    db: Session = Depends(get_db),
+):
+    """Get the status of an analysis batch, storing its results once it has finished."""
+    model_name = ANALYSIS_MODELS.get(model_provider)
+    if model_name is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported provider: {model_provider}")
+
+    client = async_llm_client(model_provider)
+    answers = {}
+    try:
+        if model_provider == "anthropic":
+            batch = await client.messages.batches.retrieve(batch_id)
+            status = batch.processing_status
+            if status == "ended":
+                async for entry in await client.messages.batches.results(batch_id):
+                    if entry.result.type == "succeeded":
+                        answers[entry.custom_id] = (entry.result.message.content[0].text, None)
+                    else:
+                        answers[entry.custom_id] = (None, f"Request {entry.result.type}")
+        else:
+            batch = await client.batches.retrieve(batch_id)
+            status = batch.status
+            # Expired and cancelled batches still return whatever had completed
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id or status not in ("completed", "expired", "cancelled"):
+                    continue
+                content = await client.files.content(file_id)
+                for line in content.text.splitlines():
+                    entry = orjson.loads(line)
+                    response = entry.get("response") or {}
+                    if response.get("status_code") == 200:
+                        answers[entry["custom_id"]] = (response["body"]["choices"][0]["message"]["content"], None)
+                    else:
+                        answers[entry["custom_id"]] = (None, str(entry.get("error") or response.get("body")))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI batch retrieval failed: {str(e)}")
+
+    results = await run_in_threadpool(_store_analysis_batch, db, model_name, answers) if answers else {}
+
+    return {
+        "batch_id": batch_id,
+        "model_provider": model_provider,
+        "status": status,
+        "results": results,
+    }
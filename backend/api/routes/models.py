@@ -2,10 +2,12 @@
 
 import os
 import httpx
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from backend.api.deps import get_db
@@ -161,8 +163,13 @@ PROVIDER_DISPLAY_NAMES = {
 }
 
 
+@lru_cache(maxsize=None)
 def check_provider_configured(provider: str) -> bool:
-    """Check if provider API key is configured."""
+    """Check if provider API key is configured.
+
+    Keys are read from the environment (and .env) at startup, so the answer
+    holds for the life of the process.
+    """
     if provider == "anthropic":
         return bool(os.getenv("ANTHROPIC_API_KEY"))
     elif provider == "openai":
@@ -172,10 +179,18 @@ def check_provider_configured(provider: str) -> bool:
     return False
 
 
+# Set once the models table is known to be populated, to skip the check per request
+_models_seeded = False
+
+
 def seed_default_models(db: Session):
     """Seed default extraction models if not present."""
-    existing_count = db.query(ExtractionModel).count()
-    if existing_count == 0:
+    global _models_seeded
+    if _models_seeded:
+        return
+
+    existing = db.query(db.query(ExtractionModel.id).exists()).scalar()
+    if not existing:
         for model_config in DEFAULT_MODELS:
             model = ExtractionModel(
                 provider=model_config["provider"],
@@ -188,9 +203,11 @@ def seed_default_models(db: Session):
             db.add(model)
         db.commit()
 
+    _models_seeded = True
+
 
 @router.get("/", response_model=list[ExtractionModelResponse])
-async def list_available_models(
+def list_available_models(
     db: Session = Depends(get_db)
 ):
     """List available extraction models."""
@@ -216,7 +233,7 @@ async def list_available_models(
 
 
 @router.get("/picker")
-async def get_model_picker_data(
+def get_model_picker_data(
     db: Session = Depends(get_db)
 ):
     """Get models grouped by provider for the picker UI."""
@@ -339,7 +356,7 @@ async def get_anthropic_models(db: Session = Depends(get_db)):
             models_by_family[family].sort(key=lambda x: x.get("created_at", ""), reverse=True)
 
         # Check for DB-configured featured models
-        db_featured = get_featured_model_configs(db, "anthropic")
+        db_featured = await run_in_threadpool(get_featured_model_configs, db, "anthropic")
 
         if db_featured:
             # Use DB configuration
@@ -447,7 +464,7 @@ async def get_openai_models(db: Session = Depends(get_db)):
             models_by_family[family].sort(key=lambda x: x.get("created", 0), reverse=True)
 
         # Check for DB-configured featured models
-        db_featured = get_featured_model_configs(db, "openai")
+        db_featured = await run_in_threadpool(get_featured_model_configs, db, "openai")
 
         if db_featured:
             # Use DB configuration
@@ -526,7 +543,7 @@ def get_featured_model_display_name(db: Session, provider: str, model_id: str) -
 
 
 @router.get("/featured/{provider}", response_model=FeaturedModelsResponse)
-async def get_featured_models(
+def get_featured_models(
     provider: str,
     db: Session = Depends(get_db)
 ):
@@ -554,7 +571,7 @@ async def get_featured_models(
 
 
 @router.put("/featured", response_model=FeaturedModelsResponse)
-async def update_featured_models(
+def update_featured_models(
     data: FeaturedModelsUpdate,
     db: Session = Depends(get_db)
 ):
@@ -149,7 +149,7 @@ def portfolio_item_to_response(item: PortfolioItem) -> PortfolioItemResponse:
 # =============================================================================
 
 @router.get("/products/list", response_model=InsuranceProductListResponse)
-async def list_insurance_products(
+def list_insurance_products(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     search: Optional[str] = None,
@@ -221,7 +221,7 @@ async def list_insurance_products(
 # =============================================================================
 
 @router.get("", response_model=PortfolioListResponse)
-async def list_portfolios(
+def list_portfolios(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     search: Optional[str] = None,
@@ -256,7 +256,7 @@ async def list_portfolios(
 
 
 @router.post("", response_model=PortfolioResponse)
-async def create_portfolio(
+def create_portfolio(
     data: PortfolioCreate,
     db: Session = Depends(get_db),
 ):
@@ -314,7 +314,7 @@ async def create_portfolio(
 
 
 @router.get("/{portfolio_id}", response_model=PortfolioResponse)
-async def get_portfolio(
+def get_portfolio(
     portfolio_id: str,
     db: Session = Depends(get_db),
 ):
@@ -345,7 +345,7 @@ async def get_portfolio(
 
 
 @router.put("/{portfolio_id}", response_model=PortfolioResponse)
-async def update_portfolio(
+def update_portfolio(
     portfolio_id: str,
     data: PortfolioUpdate,
     db: Session = Depends(get_db),
@@ -410,7 +410,7 @@ async def update_portfolio(
 
 
 @router.delete("/{portfolio_id}")
-async def delete_portfolio(
+def delete_portfolio(
     portfolio_id: str,
     db: Session = Depends(get_db),
 ):
@@ -430,7 +430,7 @@ async def delete_portfolio(
 # =============================================================================
 
 @router.post("/{portfolio_id}/items", response_model=PortfolioItemResponse)
-async def add_portfolio_item(
+def add_portfolio_item(
     portfolio_id: str,
     data: PortfolioItemCreate,
     db: Session = Depends(get_db),
@@ -474,7 +474,7 @@ async def add_portfolio_item(
 
 
 @router.put("/{portfolio_id}/items/{item_id}", response_model=PortfolioItemResponse)
-async def update_portfolio_item(
+def update_portfolio_item(
     portfolio_id: str,
     item_id: str,
     data: PortfolioItemUpdate,
@@ -505,7 +505,7 @@ async def update_portfolio_item(
 
 
 @router.delete("/{portfolio_id}/items/{item_id}")
-async def remove_portfolio_item(
+def remove_portfolio_item(
     portfolio_id: str,
     item_id: str,
     db: Session = Depends(get_db),
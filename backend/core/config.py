@@ -35,6 +35,23 @@ if USE_SQLITE:
 else:
     SQLALCHEMY_DATABASE_URL = DATABASE_URL
 
+# Connection pool. Sized above the 40-thread FastAPI threadpool so sync
+# routes don't queue on pool checkout under burst traffic.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+# Extraction jobs run on their own thread pool, separate from request handling
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "4"))
+
+# Outgoing suggestion calls per LLM provider: concurrent requests and requests
+# started per minute, kept under the provider's rate limits to avoid 429s
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "20"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "50"))
+
+# Product analyses run at once for one batch-analyze request
+PRODUCT_ANALYSIS_CONCURRENCY = int(os.getenv("PRODUCT_ANALYSIS_CONCURRENCY", "5"))
+
 # API settings
 API_V1_PREFIX = "/api"
 PROJECT_NAME = "Product Intelligence"
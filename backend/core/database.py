@@ -1,26 +1,115 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+import json
+import logging
+
+from sqlalchemy import JSON, Integer, String, bindparam, create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.sql.functions import FunctionElement
 
-from backend.core.config import SQLALCHEMY_DATABASE_URL, USE_SQLITE
+from backend.core.config import (
+    SQLALCHEMY_DATABASE_URL,
+    USE_SQLITE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+)
 
 # Create engine with appropriate settings
 if USE_SQLITE:
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False}  # SQLite specific
+        connect_args={"check_same_thread": False},  # SQLite specific
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
     )
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        pool_use_lifo=True,  # let surplus connections idle out after bursts
+    )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+logger = logging.getLogger(__name__)
+
 # Base class for models
 Base = declarative_base()
 
 
+class json_key_count(FunctionElement):
+    """Number of keys in a JSON object column, counted in the database."""
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(json_key_count)
+def _json_key_count_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"CASE WHEN json_type({column}) = 'object' THEN (SELECT count(*) FROM json_each({column})) ELSE 0 END"
+
+
+@compiles(json_key_count, "postgresql")
+def _json_key_count_postgresql(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"CASE WHEN json_typeof({column}) = 'object' THEN (SELECT count(*) FROM json_object_keys({column})) ELSE 0 END"
+
+
+class json_merge(FunctionElement):
+    """Shallow merge of a dict into a JSON object column, done in the database.
+
+    Keys in the patch overwrite existing ones, including with null, matching
+    ``dict.update``.
+    """
+    type = JSON()
+    inherit_cache = False  # the SQLite form embeds the patch keys
+
+    def __init__(self, column, patch: dict):
+        self.keys = tuple(patch)
+        super().__init__(column, bindparam("json_patch", json.dumps(patch), type_=String(), unique=True))
+
+
+def json_merge_supported(bind, patch: dict) -> bool:
+    """Whether json_merge can apply this patch on the given connection.
+
+    SQLite JSON paths have no escape for a double quote, so keys containing
+    one must be merged in Python instead.
+    """
+    return bind.dialect.name != "sqlite" or not any('"' in key for key in patch)
+
+
+@compiles(json_merge)
+def _json_merge_sqlite(element, compiler, **kw):
+    unsupported = [key for key in element.keys if '"' in key]
+    if unsupported:
+        # json_set() would silently skip such a path instead of failing
+        raise ValueError(f"JSON keys with double quotes cannot be merged in SQLite: {unsupported}")
+    column, patch = (compiler.process(clause, **kw) for clause in element.clauses)
+    # json_patch() would drop null-valued keys, so set each key explicitly
+    assignments = "".join(
+        f", {path}, {patch} -> {path}"
+        for path in (
+            compiler.render_literal_value(f'$."{key}"', String())
+            for key in element.keys
+        )
+    )
+    return f"json_set(CASE WHEN json_type({column}) = 'object' THEN {column} ELSE '{{}}' END{assignments})"
+
+
+@compiles(json_merge, "postgresql")
+def _json_merge_postgresql(element, compiler, **kw):
+    column, patch = (compiler.process(clause, **kw) for clause in element.clauses)
+    current = f"CASE WHEN json_typeof({column}) = 'object' THEN CAST({column} AS JSONB) ELSE '{{}}'::jsonb END"
+    return f"CAST(({current}) || CAST({patch} AS JSONB) AS JSON)"
+
+
 def get_db():
     """Dependency to get database session."""
     db = SessionLocal()
@@ -37,3 +126,12 @@ def init_db():
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so add any missing indexes. A
+    # role without the privilege to do so still starts, just without the index
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except SQLAlchemyError as e:
+                logger.warning("Could not create index %s: %s", index.name, e)
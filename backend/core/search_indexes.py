@@ -0,0 +1,53 @@
+"""One-off setup of the PostgreSQL trigram indexes behind ILIKE '%term%' search.
+
+These are kept out of init_db: enabling pg_trgm needs a role allowed to
+create extensions, and building a GIN index on a large table is slow.
+Run this once per PostgreSQL database, as such a role:
+
+    python -m backend.core.search_indexes
+
+Indexes are built CONCURRENTLY, so writes are not blocked while they
+build, and existing ones are skipped, so it is safe to re-run (a build
+that failed leaves an INVALID index, which must be dropped first). Without
+them search still works, only with sequential scans. SQLite needs nothing.
+"""
+
+from sqlalchemy import text
+
+from backend.core.database import engine
+
+# Columns matched by the authority and contract search filters, by table
+TRIGRAM_INDEXED_COLUMNS = {
+    "authorities": (
+        "contract_name",
+        "lob_name",
+        "cob_name",
+        "product_name",
+        "sub_product_name",
+        "mpp_name",
+    ),
+    "contracts": ("original_filename",),
+}
+
+
+def create_search_indexes():
+    """Enable pg_trgm and create any missing trigram index."""
+    if engine.dialect.name != "postgresql":
+        print("Trigram indexes are only used on PostgreSQL; nothing to do.")
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, columns in TRIGRAM_INDEXED_COLUMNS.items():
+            for column in columns:
+                name = f"ix_{table}_{column}_trgm"
+                print(f"Creating {name}...")
+                conn.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+
+
+if __name__ == "__main__":
+    create_search_indexes()
@@ -1,6 +1,9 @@
 """Product Intelligence Backend API - FastAPI Application."""
 
+import hashlib
+import logging
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,6 +11,34 @@ from fastapi.middleware.cors import CORSMiddleware
 from backend.core.config import API_V1_PREFIX, PROJECT_NAME, CORS_ORIGINS
 from backend.core.database import init_db
 from backend.api.routes import api_router
+from backend.api.routes.extractions import extraction_executor
+
+logger = logging.getLogger(__name__)
+
+
+def check_sha256_acceleration():
+    """Warn when upload hashing (hashlib.sha256) cannot use the CPU's SHA-256 instructions.
+
+    The OpenSSL that hashlib links (1.1.1 or newer on every supported Python)
+    picks SHA-NI or ARMv8 SHA2 at runtime, so what matters is that hashlib is
+    OpenSSL-backed and the CPU advertises the extension.
+    """
+    if hashlib.sha256.__module__ != "_hashlib":
+        logger.warning("hashlib.sha256 is not backed by OpenSSL; upload hashing will be slow")
+        return
+
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        return  # not Linux; nothing to inspect
+
+    flags = set()
+    for line in cpuinfo.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() in ("flags", "Features"):  # x86, ARM
+            flags.update(value.split())
+    if flags and not flags & {"sha_ni", "sha2"}:
+        logger.warning("CPU has no SHA-256 instructions (sha_ni/sha2); upload hashing will be slow")
 
 
 @asynccontextmanager
@@ -15,11 +46,13 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     print(f"Starting {PROJECT_NAME} API...")
+    check_sha256_acceleration()
     init_db()
     print("Database initialized")
     yield
     # Shutdown
     print("Shutting down...")
+    extraction_executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
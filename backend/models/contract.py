@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, Text, ForeignKey, JSON, Index, text
 from sqlalchemy.orm import relationship
 
 from backend.core.database import Base
@@ -42,6 +42,18 @@ class Contract(Base):
     versions = relationship("ContractVersion", back_populates="contract", cascade="all, delete-orphan")
     extractions = relationship("Extraction", back_populates="contract", cascade="all, delete-orphan")
 
+    # original_filename search is backed on PostgreSQL by a trigram index
+    # created once with backend.core.search_indexes
+    __table_args__ = (
+        # Contract list ordering skips soft-deleted rows
+        Index(
+            "ix_contracts_live_uploaded",
+            uploaded_at.desc(),
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Contract {self.id}: {self.original_filename}>"
 
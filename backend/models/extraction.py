@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, JSON, Boolean, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, JSON, Boolean, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 
 from backend.core.database import Base
@@ -48,6 +48,23 @@ class Extraction(Base):
     contract = relationship("Contract", back_populates="extractions")
     version = relationship("ContractVersion", back_populates="extractions")
 
+    __table_args__ = (
+        # Latest extraction per contract (contract list status column)
+        Index(
+            "ix_extractions_contract_created",
+            contract_id,
+            created_at.desc(),
+            postgresql_include=["status", "id"],
+        ),
+        # Completed extractions per contract (exports, backfills)
+        Index(
+            "ix_extractions_contract_completed",
+            contract_id,
+            postgresql_where=text("status = 'completed'"),
+            sqlite_where=text("status = 'completed'"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Extraction {self.id}: {self.status}>"
 
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Boolean, Date, Text, Float, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Boolean, Date, Text, Float, UniqueConstraint, Index
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import relationship
 
@@ -157,6 +157,11 @@ class GWPBreakdown(Base):
     member_product_program = relationship("MemberProductProgram", back_populates="gwp_breakdowns")
     term_mappings = relationship("ContractTermMapping", back_populates="gwp_breakdown", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Per-member GWP sums and a member's products by GWP, read from the index alone
+        Index("ix_gwp_breakdown_member_gwp", member_id, total_gwp),
+    )
+
     def __repr__(self):
         return f"<GWPBreakdown member={self.member_id} gwp={self.total_gwp}>"
 
@@ -186,6 +191,12 @@ class MemberContract(Base):
     member = relationship("Member", back_populates="member_contracts")
     contract = relationship("Contract", backref="member_contracts")
 
+    __table_args__ = (
+        # Link lookups by (member, contract) and a member's links newest first
+        Index("ix_member_contracts_member_contract", member_id, contract_id),
+        Index("ix_member_contracts_member_created", member_id, created_at.desc()),
+    )
+
     def __repr__(self):
         return f"<MemberContract member={self.member_id} contract={self.contract_id} {self.version_number}>"
 
@@ -339,6 +350,9 @@ class Authority(Base):
     contract_link = relationship("ContractProductLink")
     gwp_breakdown = relationship("GWPBreakdown")
 
+    # The list_authorities search filter is backed on PostgreSQL by trigram
+    # indexes created once with backend.core.search_indexes
+
     def __repr__(self):
         return f"<Authority id={self.id} member={self.member_id} product={self.product_name}>"
 
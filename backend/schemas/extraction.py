@@ -1,7 +1,7 @@
 """Extraction API schemas."""
 
 from datetime import datetime
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Literal
 from pydantic import BaseModel, Field
 
 
@@ -9,7 +9,7 @@ class ExtractionRequest(BaseModel):
     """Request to start an extraction."""
 
     contract_id: str
-    model_provider: str = "anthropic"  # anthropic, openai, landing_ai
+    model_provider: Literal["anthropic", "openai", "landing_ai"] = "anthropic"
     model_name: str = "claude-opus-4-20250514"
     version_id: Optional[str] = None
 
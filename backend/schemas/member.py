@@ -3,7 +3,7 @@
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # =============================================================================
@@ -356,7 +356,7 @@ class SuggestProductsRequest(BaseModel):
     """Request AI suggestion for products."""
     extraction_id: str
     member_id: str
-    model_provider: str = "anthropic"
+    model_provider: str | list[str] = "anthropic"  # several providers are queried together and merged
 
 
 class SuggestProductsResponse(BaseModel):
@@ -407,6 +407,12 @@ class ProductExtractionResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime] = None
 
+    @field_validator("extracted_data", mode="before")
+    @classmethod
+    def _empty_extracted_data(cls, value):
+        """Treat a NULL extracted_data column as no fields."""
+        return value or {}
+
     class Config:
         from_attributes = True
 
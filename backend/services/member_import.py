@@ -2,7 +2,7 @@
 
 import pandas as pd
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import Tuple, Dict
 
 from backend.models.member import (
@@ -203,7 +203,13 @@ def get_member_gwp_tree(db: Session, member_uuid: str) -> Dict:
         return None
 
     # Get all GWP breakdowns for this member with joined dimensions
-    breakdowns = db.query(GWPBreakdown).filter(
+    breakdowns = db.query(GWPBreakdown).options(
+        joinedload(GWPBreakdown.line_of_business),
+        joinedload(GWPBreakdown.class_of_business),
+        joinedload(GWPBreakdown.product),
+        joinedload(GWPBreakdown.sub_product),
+        joinedload(GWPBreakdown.member_product_program),
+    ).filter(
         GWPBreakdown.member_id == member_uuid
     ).all()
 
@@ -0,0 +1,54 @@
+"""Shared fixtures for API tests against a throwaway SQLite database."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.api import deps
+from backend.core import database
+from backend.core.database import Base
+from backend.main import app
+
+
+@pytest.fixture
+def db_sessionmaker(tmp_path, monkeypatch):
+    """Session factory bound to a fresh SQLite file with all tables created."""
+    from backend.models import contract, extraction, member, portfolio  # noqa: F401
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Background tasks and streamed exports open their own sessions
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_sessionmaker):
+    """Session for arranging and checking test data."""
+    session = db_sessionmaker()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db_sessionmaker):
+    """Test client whose requests use the test database."""
+    def override_get_db():
+        session = db_sessionmaker()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[deps.get_db] = override_get_db
+    app.dependency_overrides[database.get_db] = override_get_db
+    # Not entered as a context manager, so startup (init_db) does not run
+    yield TestClient(app)
+    app.dependency_overrides.clear()
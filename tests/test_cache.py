@@ -0,0 +1,60 @@
+"""Tests for the in-process TTL cache."""
+
+import pytest
+
+from backend.core import cache
+from backend.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Tests for expiry and eviction of cached values."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test a value is served until its TTL passes."""
+        ttl_cache = TTLCache(ttl=10, maxsize=4)
+        ttl_cache.set("a", 1)
+
+        clock[0] += 10
+        assert ttl_cache.get("a") == 1
+        clock[0] += 1
+        assert ttl_cache.get("a") is None
+        assert len(ttl_cache) == 0
+
+    def test_non_expiring_entries(self, clock):
+        """Test values set without expiry outlive the TTL."""
+        ttl_cache = TTLCache(ttl=10, maxsize=4)
+        ttl_cache.set("a", 1, expires=False)
+
+        clock[0] += 1_000_000
+        assert ttl_cache.get("a") == 1
+
+    def test_least_recently_used_is_evicted(self, clock):
+        """Test the size cap evicts the least recently read or written value."""
+        ttl_cache = TTLCache(ttl=10, maxsize=2)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")
+        ttl_cache.set("c", 3)
+
+        assert ttl_cache.get("b") is None
+        assert (ttl_cache.get("a"), ttl_cache.get("c")) == (1, 3)
+
+    def test_pop_and_clear(self, clock):
+        """Test values can be dropped one at a time or all at once."""
+        ttl_cache = TTLCache(ttl=10, maxsize=4)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+
+        ttl_cache.pop("a")
+        ttl_cache.pop("missing")
+        assert ttl_cache.get("a") is None
+        ttl_cache.clear()
+        assert len(ttl_cache) == 0
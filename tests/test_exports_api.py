@@ -0,0 +1,135 @@
+"""Tests for the export endpoints."""
+
+import csv
+import io
+import os
+import time
+
+import pytest
+
+from backend.api.routes import exports
+from backend.models.contract import Contract
+from backend.models.extraction import Extraction
+
+
+@pytest.fixture
+def export_extractions(db, tmp_path, monkeypatch):
+    """Two completed extractions with different fields and one pending one."""
+    monkeypatch.setattr(exports, "EXPORTS_DIR", tmp_path)
+    db.add(Contract(
+        id="c1", filename="c1.pdf", original_filename="Contract 1.pdf",
+        file_path="/tmp/c1.pdf", file_type="pdf", file_size_bytes=1, file_hash="h1",
+    ))
+    db.add(Extraction(
+        id="e1", contract_id="c1", model_provider="anthropic", model_name="m",
+        status="completed", extracted_data={"a": 1, "b": "x"},
+    ))
+    db.add(Extraction(
+        id="e2", contract_id="c1", model_provider="anthropic", model_name="m",
+        status="completed", extracted_data={"b": "y", "c": None},
+    ))
+    db.add(Extraction(id="e3", contract_id="c1", model_provider="anthropic", model_name="m", status="pending"))
+    db.commit()
+
+
+def create_export(client, extraction_ids, export_format):
+    return client.post("/api/exports/", json={"extraction_ids": extraction_ids, "format": export_format})
+
+
+class TestCsvJsonExports:
+    """Tests for exports streamed from the database on download."""
+
+    def test_csv_has_every_field(self, client, export_extractions):
+        """Test the CSV header is the union of all extractions' fields."""
+        response = create_export(client, ["e1", "e2", "e3"], "csv")
+        assert response.status_code == 200
+        assert response.json()["extraction_count"] == 2
+
+        download = client.get(response.json()["download_url"])
+
+        assert download.status_code == 200
+        assert download.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(download.text)))
+        assert sorted(rows[0]) == ["a", "b", "c"]
+        assert sorted((row["a"], row["b"], row["c"]) for row in rows) == [("", "y", ""), ("1", "x", "")]
+
+    def test_json_export(self, client, export_extractions):
+        """Test the JSON export lists each completed extraction with its data."""
+        response = create_export(client, ["e1", "e2"], "json")
+
+        download = client.get(response.json()["download_url"])
+
+        assert download.status_code == 200
+        items = {item["extraction_id"]: item for item in download.json()}
+        assert items["e1"]["data"] == {"a": 1, "b": "x"}
+        assert items["e2"]["contract_filename"] == "Contract 1.pdf"
+
+    def test_rows_are_read_at_download_time(self, client, export_extractions, db):
+        """Test edits made after the export was created show in the download."""
+        response = create_export(client, ["e1"], "json")
+        db.get(Extraction, "e1").extracted_data = {"a": 2}
+        db.commit()
+
+        assert client.get(response.json()["download_url"]).json()[0]["data"] == {"a": 2}
+
+    def test_same_second_exports_keep_their_own_rows(self, client, export_extractions):
+        """Test a second export created in the same second does not replace the first one's IDs."""
+        first = create_export(client, ["e1"], "json").json()
+        second = create_export(client, ["e2"], "json").json()
+
+        assert [item["extraction_id"] for item in client.get(first["download_url"]).json()] == ["e1"]
+        assert [item["extraction_id"] for item in client.get(second["download_url"]).json()] == ["e2"]
+
+    def test_invalid_format(self, client, export_extractions):
+        """Test an unsupported format returns 400."""
+        assert create_export(client, ["e1"], "pdf").status_code == 400
+
+    def test_no_extraction_ids(self, client, export_extractions):
+        """Test an empty ID list returns 400."""
+        assert create_export(client, [], "csv").status_code == 400
+
+    def test_no_completed_extractions(self, client, export_extractions):
+        """Test only pending or unknown extractions return 404."""
+        assert create_export(client, ["e3", "nope"], "csv").status_code == 404
+
+    def test_missing_download(self, client, export_extractions):
+        """Test downloading an unknown export returns 404."""
+        assert client.get("/api/exports/nope.csv/download").status_code == 404
+
+
+class TestExcelExports:
+    """Tests for Excel exports built in the background."""
+
+    def test_same_second_exports_get_their_own_files(self, client, export_extractions, tmp_path, monkeypatch):
+        """Test two exports created in the same second do not share a file name."""
+        monkeypatch.setattr(exports, "build_export_file", lambda file_path, extraction_ids: None)
+
+        first = create_export(client, ["e1"], "xlsx").json()
+        second = create_export(client, ["e2"], "xlsx").json()
+
+        assert first["download_url"] != second["download_url"]
+        assert first["export_id"][:8] in first["download_url"]
+        assert len(list(tmp_path.glob("*.xlsx.part"))) == 2
+
+
+class TestSweepExportFiles:
+    """Tests for removing expired export bookkeeping files."""
+
+    def test_old_manifests_and_placeholders_are_removed(self, tmp_path, monkeypatch):
+        """Test only manifests and placeholders past their age are deleted."""
+        monkeypatch.setattr(exports, "EXPORTS_DIR", tmp_path)
+        now = time.time()
+        ages = {
+            "old.csv.ids": exports.EXPORT_MANIFEST_MAX_AGE + 60,
+            "new.csv.ids": 60,
+            "old.xlsx.part": exports.EXPORT_PART_MAX_AGE + 60,
+            "new.xlsx.part": 60,
+            "old.xlsx": exports.EXPORT_MANIFEST_MAX_AGE + 60,
+        }
+        for name, age in ages.items():
+            (tmp_path / name).write_text("x")
+            os.utime(tmp_path / name, (now - age, now - age))
+
+        exports.sweep_export_files()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["new.csv.ids", "new.xlsx.part", "old.xlsx"]
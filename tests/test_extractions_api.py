@@ -0,0 +1,59 @@
+"""Tests for the extraction API endpoints."""
+
+import pytest
+
+from backend.models.contract import Contract
+from backend.models.extraction import Extraction
+
+
+@pytest.fixture
+def extractions(db):
+    """A contract with one completed and one pending extraction."""
+    db.add(Contract(
+        id="c1", filename="c1.pdf", original_filename="Contract 1.pdf",
+        file_path="/tmp/c1.pdf", file_type="pdf", file_size_bytes=1, file_hash="h1",
+    ))
+    db.add(Extraction(
+        id="done", contract_id="c1", model_provider="anthropic", model_name="m", status="completed",
+        extracted_data={"a": 1, "keep": "x", "q\"uote": "old"},
+    ))
+    db.add(Extraction(id="pending", contract_id="c1", model_provider="anthropic", model_name="m", status="pending"))
+    db.commit()
+
+
+class TestUpdateExtraction:
+    """Tests for merging manual corrections into extracted data."""
+
+    def test_merge_keeps_nulls_lists_and_dotted_keys(self, client, extractions, db):
+        """Test null values are stored and unusual keys are set literally."""
+        patch = {"a": None, "b": [1, 2], "x.y": "dot", "arr[0]": "bracket", "it's": "apostrophe"}
+        response = client.patch("/api/extractions/done", json={"extracted_data": patch})
+
+        assert response.status_code == 200
+        expected = {"keep": "x", "q\"uote": "old", **patch}
+        assert response.json()["extracted_data"] == expected
+        assert db.get(Extraction, "done").extracted_data == expected
+
+    def test_merge_key_with_double_quote(self, client, extractions, db):
+        """Test keys containing a double quote are not dropped."""
+        patch = {"a": None, "b": [1, 2], "q\"uote": "z"}
+        response = client.patch("/api/extractions/done", json={"extracted_data": patch})
+
+        assert response.status_code == 200
+        expected = {"keep": "x", "a": None, "b": [1, 2], "q\"uote": "z"}
+        assert response.json()["extracted_data"] == expected
+        assert db.get(Extraction, "done").extracted_data == expected
+
+    @pytest.mark.parametrize("patch", [{"a": 2}, {"q\"uote": "z"}])
+    def test_missing_extraction(self, client, extractions, patch):
+        """Test updating an unknown extraction returns 404."""
+        response = client.patch("/api/extractions/nope", json={"extracted_data": patch})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("patch", [{"a": 2}, {"q\"uote": "z"}])
+    def test_incomplete_extraction(self, client, extractions, db, patch):
+        """Test only completed extractions can be corrected."""
+        response = client.patch("/api/extractions/pending", json={"extracted_data": patch})
+
+        assert response.status_code == 400
+        assert db.get(Extraction, "pending").extracted_data in (None, {})
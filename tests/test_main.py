@@ -0,0 +1,42 @@
+"""Tests for application startup checks."""
+
+import logging
+
+import pytest
+
+from backend import main
+
+
+@pytest.fixture
+def cpuinfo(tmp_path, monkeypatch):
+    """Point the startup check at a fake /proc/cpuinfo with the given text."""
+    real_path = main.Path
+
+    def write(text):
+        fake = tmp_path / "cpuinfo"
+        fake.write_text(text)
+        monkeypatch.setattr(main, "Path", lambda path: fake if path == "/proc/cpuinfo" else real_path(path))
+
+    return write
+
+
+class TestCheckSha256Acceleration:
+    """Tests for the SHA-256 hardware acceleration warning."""
+
+    @pytest.mark.parametrize("text", [
+        "processor\t: 0\nflags\t\t: fpu sse2 sha_ni avx2\n",
+        "processor\t: 0\nFeatures\t: fp asimd aes sha1 sha2\n",
+    ])
+    def test_no_warning_with_sha_extensions(self, cpuinfo, caplog, text):
+        """Test x86 SHA-NI and ARMv8 SHA2 both count as accelerated."""
+        cpuinfo(text)
+        with caplog.at_level(logging.WARNING, logger=main.__name__):
+            main.check_sha256_acceleration()
+        assert caplog.records == []
+
+    def test_warns_without_sha_extensions(self, cpuinfo, caplog):
+        """Test a CPU without SHA extensions is reported."""
+        cpuinfo("processor\t: 0\nflags\t\t: fpu sse2 avx2\n")
+        with caplog.at_level(logging.WARNING, logger=main.__name__):
+            main.check_sha256_acceleration()
+        assert "no SHA-256 instructions" in caplog.text
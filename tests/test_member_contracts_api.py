@@ -0,0 +1,111 @@
+"""Tests for the member-contract link and versioning endpoints."""
+
+import pytest
+
+from backend.models.contract import Contract
+from backend.models.member import Member, MemberContract
+
+
+@pytest.fixture
+def member_contracts(db):
+    """A member linked to one contract, plus two contracts not linked yet."""
+    db.add(Member(id="m1", member_id="PTY-000001", name="Member 1"))
+    for i in range(1, 4):
+        db.add(Contract(
+            id=f"c{i}", filename=f"c{i}.pdf", original_filename=f"Contract {i}.pdf",
+            file_path=f"/tmp/c{i}.pdf", file_type="pdf", file_size_bytes=1, file_hash=f"h{i}",
+        ))
+    db.add(MemberContract(id="mc1", member_id="m1", contract_id="c1", version_number="v1"))
+    db.commit()
+
+
+def member_links(db, member_id="m1"):
+    """(contract_id, version_number, is_current) for each of a member's links."""
+    db.expire_all()
+    return sorted(
+        (mc.contract_id, mc.version_number, mc.is_current)
+        for mc in db.query(MemberContract).filter(MemberContract.member_id == member_id)
+    )
+
+
+class TestCreateNewContractVersion:
+    """Tests for superseding a member's contract with a new version."""
+
+    def test_new_version_supersedes_current(self, client, member_contracts, db):
+        """Test the current version is retired and the new one numbered after it."""
+        response = client.post("/api/members/m1/contracts/c1/new-version?new_contract_id=c2")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["contract_id"], body["version_number"], body["is_current"]) == ("c2", "v2", True)
+        assert body["contract_filename"] == "Contract 2.pdf"
+        assert member_links(db) == [("c1", "v1", False), ("c2", "v2", True)]
+
+    def test_superseded_version_conflicts(self, client, member_contracts, db):
+        """Test a second bump of an already superseded version is rejected, not numbered v1."""
+        assert client.post("/api/members/m1/contracts/c1/new-version?new_contract_id=c2").status_code == 200
+
+        response = client.post("/api/members/m1/contracts/c1/new-version?new_contract_id=c3")
+
+        assert response.status_code == 409
+        assert member_links(db) == [("c1", "v1", False), ("c2", "v2", True)]
+
+    def test_first_version_of_unlinked_contract(self, client, member_contracts, db):
+        """Test a contract the member has no versions of starts at v1."""
+        response = client.post("/api/members/PTY-000001/contracts/c3/new-version?new_contract_id=c3")
+
+        assert response.status_code == 200
+        assert response.json()["version_number"] == "v1"
+
+    def test_missing_member(self, client, member_contracts):
+        """Test an unknown member returns 404."""
+        response = client.post("/api/members/nope/contracts/c1/new-version?new_contract_id=c2")
+        assert response.status_code == 404
+
+    def test_missing_new_contract(self, client, member_contracts, db):
+        """Test an unknown new contract returns 404 and leaves the current version alone."""
+        response = client.post("/api/members/m1/contracts/c1/new-version?new_contract_id=nope")
+
+        assert response.status_code == 404
+        assert member_links(db) == [("c1", "v1", True)]
+
+
+class TestLinkContractToMember:
+    """Tests for linking a contract to a member."""
+
+    def test_link_new_contract(self, client, member_contracts, db):
+        """Test a new link is created with the requested version and date."""
+        response = client.post(
+            "/api/members/m1/contracts",
+            json={"contract_id": "c2", "version_number": "v3", "effective_date": "2024-05-01"},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["contract_id"] == "c2"
+        assert body["version_number"] == "v3"
+        assert body["effective_date"] == "2024-05-01"
+        assert body["is_current"] is True
+        assert body["contract_filename"] == "Contract 2.pdf"
+        assert db.get(MemberContract, body["id"]) is not None
+
+    def test_duplicate_link_returns_existing(self, client, member_contracts, db):
+        """Test linking an already linked contract returns the existing link unchanged."""
+        response = client.post("/api/members/m1/contracts", json={"contract_id": "c1", "version_number": "v9"})
+
+        assert response.status_code == 200
+        assert response.json()["id"] == "mc1"
+        assert response.json()["version_number"] == "v1"
+        assert member_links(db) == [("c1", "v1", True)]
+
+    def test_missing_member(self, client, member_contracts):
+        """Test an unknown member returns 404."""
+        response = client.post("/api/members/nope/contracts", json={"contract_id": "c2"})
+        assert response.status_code == 404
+
+    def test_missing_contract(self, client, member_contracts, db):
+        """Test an unknown contract returns 404 without creating a link."""
+        response = client.post("/api/members/m1/contracts", json={"contract_id": "nope"})
+
+        assert response.status_code == 404
+        assert member_links(db) == [("c1", "v1", True)]
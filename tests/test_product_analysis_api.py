@@ -0,0 +1,190 @@
+"""Tests for the contract-product analysis endpoint."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from backend.api.routes.members import ANALYSIS_BATCH_WINDOW, _prepare_analysis_batch
+from backend.models.contract import Contract
+from backend.models.extraction import Extraction
+from backend.models.member import (
+    Authority,
+    ClassOfBusiness,
+    ContractProductLink,
+    GWPBreakdown,
+    LineOfBusiness,
+    Member,
+    MemberProductProgram,
+    Product,
+    ProductExtraction,
+    SubProduct,
+)
+from backend.schemas.member import BatchAnalyzeRequest
+
+
+@pytest.fixture
+def analyzed_link(db):
+    """A contract-product link with a completed analysis and its authority."""
+    db.add_all([
+        Member(id="m1", member_id="PTY-000001", name="Member 1"),
+        LineOfBusiness(id="lob", lob_id="LOB-000001", name="LOB"),
+        ClassOfBusiness(id="cob", cob_id="COB-000001", name="COB"),
+        Product(id="pro", product_id="PRO-000001", name="Product"),
+        SubProduct(id="sup", sub_product_id="SUP-000001", name="Sub product"),
+        MemberProductProgram(id="mpp", mpp_id="MPP-000001", name="Program"),
+        Contract(
+            id="c1", filename="c1.pdf", original_filename="Contract 1.pdf",
+            file_path="/tmp/c1.pdf", file_type="pdf", file_size_bytes=1, file_hash="h1",
+        ),
+    ])
+    db.flush()
+    db.add(GWPBreakdown(
+        id="g1", member_id="m1", lob_id="lob", cob_id="cob", product_id="pro",
+        sub_product_id="sup", mpp_id="mpp", total_gwp=10,
+    ))
+    db.add(Extraction(
+        id="e1", contract_id="c1", model_provider="anthropic", model_name="m",
+        status="completed", extracted_data={"limit": "1M"},
+    ))
+    db.flush()
+    db.add(ContractProductLink(id="l1", extraction_id="e1", gwp_breakdown_id="g1"))
+    db.flush()
+    db.add(ProductExtraction(
+        id="pe1", contract_link_id="l1", model_provider="anthropic", status="completed",
+        extracted_data={"limit": {"value": "1M"}}, analysis_summary="old",
+    ))
+    db.flush()
+    db.add(Authority(
+        id="a1", product_extraction_id="pe1", contract_link_id="l1", member_id="m1", gwp_breakdown_id="g1",
+        extracted_data={"limit": {"value": "1M"}}, analysis_summary="old",
+    ))
+    db.commit()
+
+
+class TestAnalyzeProductExtraction:
+    """Tests for (re-)analyzing a contract-product link."""
+
+    def test_completed_analysis_is_returned(self, client, analyzed_link):
+        """Test an unforced request returns the stored analysis without calling a model."""
+        response = client.post(
+            "/api/members/product-extractions/analyze",
+            json={"contract_link_id": "l1", "model_provider": "nope"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == "pe1"
+        assert response.json()["analysis_summary"] == "old"
+
+    def test_failed_forced_run_clears_authority(self, client, analyzed_link, db):
+        """Test a failed forced re-analysis keeps the authority but drops its stale data."""
+        response = client.post(
+            "/api/members/product-extractions/analyze",
+            json={"contract_link_id": "l1", "model_provider": "nope", "force": True},
+        )
+
+        assert "Unsupported provider" in response.json()["detail"]
+        db.expire_all()
+        assert db.get(ProductExtraction, "pe1").status == "failed"
+        authority = db.get(Authority, "a1")
+        assert authority is not None
+        assert authority.extracted_data == {}
+        assert authority.analysis_summary is None
+
+    def test_missing_link(self, client, analyzed_link):
+        """Test an unknown link returns 404."""
+        response = client.post("/api/members/product-extractions/analyze", json={"contract_link_id": "nope"})
+        assert response.status_code == 404
+
+
+def add_links(db, count, status=None, created_at=None):
+    """Add product links to extraction e1, each with its own GWP row and optionally an analysis."""
+    start = db.query(ContractProductLink).count() + 1
+    ids = []
+    for i in range(start, start + count):
+        db.add(GWPBreakdown(
+            id=f"g{i}", member_id="m1", lob_id="lob", cob_id="cob", product_id="pro",
+            sub_product_id="sup", mpp_id="mpp", total_gwp=i,
+        ))
+        db.flush()
+        db.add(ContractProductLink(id=f"l{i}", extraction_id="e1", gwp_breakdown_id=f"g{i}"))
+        if status:
+            db.flush()
+            db.add(ProductExtraction(
+                id=f"pe{i}", contract_link_id=f"l{i}", model_provider="anthropic",
+                status=status, created_at=created_at,
+            ))
+        ids.append(f"l{i}")
+    db.commit()
+    return ids
+
+
+def count_queries(db, func):
+    """Run func and return how many SQL statements it executed."""
+    statements = []
+
+    def record(*_):
+        statements.append(1)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+class TestPrepareAnalysisBatch:
+    """Tests for preparing a provider batch of product analyses."""
+
+    def test_queues_links_needing_analysis(self, analyzed_link, db):
+        """Test completed and recently submitted links are skipped, the rest marked processing."""
+        new = add_links(db, 2)
+        failed = add_links(db, 1, status="failed", created_at=datetime.utcnow() - timedelta(days=3))
+        in_flight = add_links(db, 1, status="processing", created_at=datetime.utcnow() - timedelta(hours=1))
+
+        prompts = _prepare_analysis_batch(db, BatchAnalyzeRequest(extraction_id="e1", model_provider="openai"))
+
+        assert sorted(prompts) == sorted(new + failed)
+        system_prompt, document_prompt, task_prompt = prompts[new[0]]
+        assert "limit" in system_prompt and "1M" in document_prompt
+        assert task_prompt != prompts[new[1]][2]
+        db.expire_all()
+        rows = {pe.contract_link_id: pe for pe in db.query(ProductExtraction)}
+        assert rows["l1"].status == "completed"
+        assert rows[in_flight[0]].status == "processing"
+        for link_id in new + failed:
+            assert (rows[link_id].status, rows[link_id].model_provider) == ("processing", "openai")
+        assert datetime.utcnow() - rows[failed[0]].created_at < timedelta(minutes=1)
+
+    def test_stale_processing_rows_are_requeued(self, analyzed_link, db):
+        """Test a link left processing past the batch window is queued again."""
+        submitted_at = datetime.utcnow() - ANALYSIS_BATCH_WINDOW - timedelta(hours=1)
+        stale = add_links(db, 1, status="processing", created_at=submitted_at)
+
+        prompts = _prepare_analysis_batch(db, BatchAnalyzeRequest(extraction_id="e1"))
+
+        assert list(prompts) == stale
+        assert db.query(ProductExtraction).filter(ProductExtraction.contract_link_id == stale[0]).count() == 1
+
+    def test_query_count_does_not_grow_with_links(self, analyzed_link, db_sessionmaker):
+        """Test preparing more links costs no more statements."""
+        def prepare(count):
+            session = db_sessionmaker()
+            try:
+                add_links(session, count)
+                return count_queries(session, lambda: _prepare_analysis_batch(
+                    session, BatchAnalyzeRequest(extraction_id="e1")
+                ))
+            finally:
+                session.close()
+
+        assert prepare(1) == prepare(5)
+
+    def test_missing_links(self, analyzed_link, db):
+        """Test an extraction without product links returns 404."""
+        with pytest.raises(HTTPException) as raised:
+            _prepare_analysis_batch(db, BatchAnalyzeRequest(extraction_id="nope"))
+        assert raised.value.status_code == 404
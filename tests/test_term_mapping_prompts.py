@@ -0,0 +1,45 @@
+"""Tests for building term-mapping suggestion prompts."""
+
+from backend.api.routes.members import SUGGESTION_FIELD_LIMIT, SuggestMappingsRequest, _term_mapping_prompts
+
+
+def suggest_request(fields, products):
+    return SuggestMappingsRequest(
+        extraction_id="e1", member_id="m1", extracted_fields=fields, product_combinations=products,
+    )
+
+
+class TestTermMappingPrompts:
+    """Tests for choosing and ordering prompt fields and products."""
+
+    def test_reordered_payload_gives_same_prompt(self):
+        """Test reordering fields within the limit, and products past it, builds the identical prompt."""
+        fields = [{"path": f"f{i:04d}", "value": str(i)} for i in range(SUGGESTION_FIELD_LIMIT)]
+        products = [{"id": f"p{i:02d}", "total_gwp": str(i % 7)} for i in range(70)]
+
+        prompts = _term_mapping_prompts(suggest_request(fields, products))
+
+        assert _term_mapping_prompts(suggest_request(fields[::-1], products[::-1])) == prompts
+
+    def test_limits_keep_highest_gwp_products_and_first_sent_fields(self):
+        """Test the cut keeps the highest-GWP products and the fields the client sent first."""
+        fields = [{"path": f"f{i:04d}", "value": "v"} for i in range(SUGGESTION_FIELD_LIMIT + 1)]
+        # Low IDs have the smallest GWP, so an ID-ordered cut would keep the wrong ones
+        products = [{"id": f"p{i:02d}", "total_gwp": str(i * 100)} for i in range(60)]
+
+        _, user_prompt = _term_mapping_prompts(suggest_request(fields[::-1], products))
+
+        assert f"- f{SUGGESTION_FIELD_LIMIT:04d}: v" in user_prompt
+        assert "- f0000: v" not in user_prompt
+        assert "ID: p59 " in user_prompt
+        assert "ID: p10 " in user_prompt
+        assert "ID: p09 " not in user_prompt
+        assert user_prompt.index("ID: p59 ") < user_prompt.index("ID: p10 ")
+
+    def test_malformed_gwp_counts_as_zero(self):
+        """Test a missing or unparsable GWP ranks a product last instead of failing."""
+        products = [{"id": "a", "total_gwp": "n/a"}, {"id": "b"}, {"id": "c", "total_gwp": "5"}]
+
+        _, user_prompt = _term_mapping_prompts(suggest_request([{"path": "x", "value": "1"}], products))
+
+        assert user_prompt.index("ID: c ") < user_prompt.index("ID: a ") < user_prompt.index("ID: b ")
@@ -0,0 +1,175 @@
+"""Tests for the batched term-mapping suggestion endpoint."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.routes import members
+from backend.api.routes.members import (
+    INVALID_SUGGESTION_REQUEST,
+    SUGGESTION_BATCH_LIMIT,
+    SUGGESTION_ERROR,
+    SUGGESTION_PACK_SIZE,
+    SUGGESTIONS_TOOL,
+    TASK_SUGGESTIONS_TOOL,
+)
+
+
+def suggest_request(extraction_id, fields=None, model_provider="anthropic"):
+    return {
+        "extraction_id": extraction_id,
+        "member_id": "m1",
+        "model_provider": model_provider,
+        "extracted_fields": fields if fields is not None else [{"path": f"{extraction_id}.limit", "value": "1M"}],
+        "product_combinations": [{"id": f"g-{extraction_id}", "total_gwp": "10"}],
+    }
+
+
+def suggestion(extraction_id):
+    return {"field_path": f"{extraction_id}.limit", "gwp_breakdown_id": f"g-{extraction_id}", "confidence": 0.9, "reason": "r"}
+
+
+class FakeAnthropic:
+    """Answers packed calls per task ID and single calls with one suggestion, recording each call."""
+
+    def __init__(self, answer_packed=None, fail_single=False):
+        self.calls = []
+        self.answer_packed = answer_packed
+        self.fail_single = fail_single
+        self.messages = SimpleNamespace(create=self.create)
+
+    async def create(self, **params):
+        tool = params["tools"][0]["name"]
+        self.calls.append((tool, params["messages"][0]["content"]))
+        if tool == TASK_SUGGESTIONS_TOOL["name"]:
+            answer = self.answer_packed(params["messages"][0]["content"])
+        else:
+            if self.fail_single:
+                raise RuntimeError("secret upstream detail")
+            extraction_id = params["messages"][0]["content"].split("- ")[1].split(".limit")[0]
+            answer = {"suggestions": [suggestion(extraction_id)]}
+        return SimpleNamespace(content=[SimpleNamespace(type="tool_use", input=answer)])
+
+    def packed_tools(self):
+        return [call for call in self.calls if call[0] == TASK_SUGGESTIONS_TOOL["name"]]
+
+    def single_tools(self):
+        return [call for call in self.calls if call[0] == SUGGESTIONS_TOOL["name"]]
+
+
+def answer_every_task(prompt):
+    """Packed answer mapping each task's field to its product, plus one cross-task mapping."""
+    task_ids = [line.split()[-1] for line in prompt.splitlines() if line.startswith("## Task ")]
+    extraction_ids = [line.split("- ")[1].split(".limit")[0] for line in prompt.splitlines() if ".limit:" in line]
+    tasks = [
+        {"task_id": task_id, "suggestions": [
+            suggestion(extraction_id),
+            suggestion(extraction_ids[(i + 1) % len(extraction_ids)]),
+        ]}
+        for i, (task_id, extraction_id) in enumerate(zip(task_ids, extraction_ids))
+    ]
+    return {"tasks": tasks}
+
+
+@pytest.fixture
+def fake_anthropic(monkeypatch):
+    """Install a fake Anthropic client, with an empty suggestion cache."""
+    members._suggestion_cache.clear()
+
+    def install(**kwargs):
+        fake = FakeAnthropic(**kwargs)
+        monkeypatch.setattr(members, "async_llm_client", lambda provider: fake)
+        return fake
+
+    yield install
+    members._suggestion_cache.clear()
+
+
+def suggest_many(client, requests):
+    return client.post("/api/members/term-mappings/suggest/many", json=requests)
+
+
+class TestSuggestManyTermMappings:
+    """Tests for answering several suggestion requests through packed model calls."""
+
+    def test_requests_share_one_call(self, client, fake_anthropic):
+        """Test requests are answered per task from one call, in request order, and cached."""
+        fake = fake_anthropic(answer_packed=answer_every_task)
+
+        response = suggest_many(client, [suggest_request("e1"), suggest_request("e2"), suggest_request("e3")])
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [{"suggestions": [suggestion(e)]} for e in ("e1", "e2", "e3")]
+        assert len(fake.calls) == 1
+
+        # Each answer is cached as if asked alone
+        single = client.post("/api/members/term-mappings/suggest", json=suggest_request("e2"))
+        assert single.json() == {"suggestions": [suggestion("e2")]}
+        assert len(fake.calls) == 1
+
+    def test_requests_are_packed_in_chunks(self, client, fake_anthropic):
+        """Test a batch larger than one pack is split into packs of SUGGESTION_PACK_SIZE."""
+        fake = fake_anthropic(answer_packed=answer_every_task)
+        count = SUGGESTION_PACK_SIZE + 2
+
+        response = suggest_many(client, [suggest_request(f"e{i}") for i in range(count)])
+
+        assert [len(result["suggestions"]) for result in response.json()["results"]] == [1] * count
+        assert len(fake.packed_tools()) == 2
+        assert fake.single_tools() == []
+
+    def test_unanswered_tasks_fall_back_to_single_calls(self, client, fake_anthropic):
+        """Test tasks missing from a packed answer are asked alone."""
+        def answer_first_task(prompt):
+            return {"tasks": answer_every_task(prompt)["tasks"][:1]}
+
+        fake = fake_anthropic(answer_packed=answer_first_task)
+
+        response = suggest_many(client, [suggest_request("e1"), suggest_request("e2"), suggest_request("e3")])
+
+        assert response.json()["results"] == [{"suggestions": [suggestion(e)]} for e in ("e1", "e2", "e3")]
+        assert len(fake.packed_tools()) == 1
+        assert len(fake.single_tools()) == 2
+
+    def test_unparsable_pack_falls_back_to_single_calls(self, client, fake_anthropic):
+        """Test a packed answer that cannot be read sends every task alone."""
+        fake = fake_anthropic(answer_packed=lambda prompt: {"unexpected": True})
+
+        response = suggest_many(client, [suggest_request("e1"), suggest_request("e2")])
+
+        assert response.json()["results"] == [{"suggestions": [suggestion(e)]} for e in ("e1", "e2")]
+        assert len(fake.single_tools()) == 2
+
+    def test_failures_are_reported_without_details(self, client, fake_anthropic):
+        """Test a failed request gets a generic error entry and does not fail the others."""
+        def fail(prompt):
+            raise RuntimeError("secret upstream detail")
+
+        fake_anthropic(answer_packed=fail, fail_single=True)
+
+        response = suggest_many(client, [
+            suggest_request("e1"), suggest_request("e2"), suggest_request("e3", model_provider="landingai"),
+        ])
+
+        assert response.status_code == 200
+        first, second, unsupported = response.json()["results"]
+        assert first == second == {"suggestions": [], "error": SUGGESTION_ERROR}
+        assert "not yet supported" in unsupported["error"]
+        assert "secret" not in response.text
+
+    def test_malformed_request_is_rejected_before_any_call(self, client, fake_anthropic):
+        """Test a field without a path fails only its own request, without a model call for it."""
+        fake = fake_anthropic(answer_packed=answer_every_task)
+
+        response = suggest_many(client, [suggest_request("bad", fields=[{"value": "x"}]), suggest_request("e2")])
+
+        assert response.json()["results"] == [
+            {"suggestions": [], "error": INVALID_SUGGESTION_REQUEST},
+            {"suggestions": [suggestion("e2")]},
+        ]
+        assert len(fake.calls) == 1
+
+    def test_too_many_requests(self, client):
+        """Test a batch over the limit is rejected with 422."""
+        response = suggest_many(client, [suggest_request(f"e{i}") for i in range(SUGGESTION_BATCH_LIMIT + 1)])
+        assert response.status_code == 422